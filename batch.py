@@ -0,0 +1,160 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cv2
+from config import settings
+from core.engine import AirDrawEngine
+from core.frame_source import VideoFileSource
+from core.hand_detector import HandDetector
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".webm")
+
+_detector = None
+
+def _init_worker():
+    # Her işçi süreç kendi HandDetector örneğini bir kez oluşturur, her videodan önce sıfırlar
+    global _detector
+    _detector = HandDetector(
+        static_mode=False,
+        max_hands=settings.MAX_HANDS,
+        detection_confidence=settings.DETECTION_CONFIDENCE,
+        tracking_confidence=settings.TRACKING_CONFIDENCE,
+        detection_scale=settings.DETECTION_SCALE,
+        detection_interval=settings.DETECTION_INTERVAL,
+        roi_tracking=settings.ROI_TRACKING,
+        motion_gating=settings.MOTION_GATING
+    )
+
+def process_video(path, output_dir, write_video=True, mirror=True):
+    name = os.path.splitext(os.path.basename(path))[0]
+    source = VideoFileSource(path, realtime=False)
+    # İşçinin dedektörü önceki videonun takip, tahmin ve hareket kapısı durumunu taşımamalı
+    _detector.reset()
+    engine = AirDrawEngine(source.width, source.height, hand_detector=_detector, mirror=mirror)
+
+    writer = None
+    video_path = None
+    if write_video:
+        video_path = os.path.join(output_dir, f"{name}_annotated.mp4")
+        writer = cv2.VideoWriter(
+            video_path,
+            cv2.VideoWriter_fourcc(*"mp4v"),
+            source.fps,
+            (source.width, source.height)
+        )
+
+    frames = 0
+    start_time = time.perf_counter()
+    try:
+        while True:
+            success, frame = source.read()
+            if not success:
+                break
+            result = engine.step(frame, source.last_timestamp)
+            if writer is not None:
+                writer.write(result.frame)
+            frames += 1
+    finally:
+        source.release()
+        if writer is not None:
+            writer.release()
+        # Geçmiş sıkıştırma iş parçacığı ve sonsuz kanvasın karo dizini her videoda kapanır
+        engine.close()
+    elapsed = time.perf_counter() - start_time
+
+    canvas_path = os.path.join(output_dir, f"{name}_canvas.png")
+    cv2.imwrite(canvas_path, engine.canvas.canvas)
+
+    return {
+        "video": os.path.basename(path),
+        "frames": frames,
+        "seconds": round(elapsed, 3),
+        "fps": round(frames / elapsed, 2) if elapsed > 0 else 0.0,
+        "canvas": canvas_path,
+        "annotated": video_path or ""
+    }
+
+def find_videos(directory):
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(VIDEO_EXTENSIONS)
+    )
+
+def write_summary(results, output_dir, wall_time):
+    summary_path = os.path.join(output_dir, "summary.csv")
+    fields = ["video", "frames", "seconds", "fps", "canvas", "annotated"]
+    with open(summary_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(results)
+
+    total_frames = sum(r["frames"] for r in results)
+    total_fps = total_frames / wall_time if wall_time > 0 else 0.0
+    logger.info(
+        f"{len(results)} video, {total_frames} kare, {wall_time:.1f} sn, toplam hız {total_fps:.1f} FPS"
+    )
+    logger.info(f"Özet kaydedildi: {summary_path}")
+    return summary_path
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="AirDraw toplu video işleme")
+    parser.add_argument("input_dir", help="Video dosyalarının bulunduğu klasör")
+    parser.add_argument("--output", default=os.path.join(settings.SAVE_DIRECTORY, "batch"), help="Çıktı klasörü")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="İşçi süreç sayısı")
+    parser.add_argument("--no-video", action="store_true", help="Sadece son kanvası kaydet")
+    parser.add_argument("--no-mirror", action="store_true", help="Kareleri aynalama")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    videos = find_videos(args.input_dir)
+    if not videos:
+        logger.error(f"Klasörde video bulunamadı: {args.input_dir}")
+        return
+
+    os.makedirs(args.output, exist_ok=True)
+    workers = max(1, min(args.workers or 1, len(videos)))
+    logger.info(f"{len(videos)} video {workers} süreçte işlenecek")
+
+    results = []
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {
+            executor.submit(process_video, path, args.output, not args.no_video, not args.no_mirror): path
+            for path in videos
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"İşlenemedi: {path} ({e})")
+                continue
+            results.append(result)
+            logger.info(f"{result['video']}: {result['frames']} kare, {result['fps']} FPS")
+
+    results.sort(key=lambda r: r["video"])
+    write_summary(results, args.output, time.perf_counter() - start_time)
+
+if __name__ == "__main__":
+    main()
+
+# -----------------------------------------------------------------
+# Kayıtlı ders videolarını toplu olarak işler. Her video ayrı bir süreçte
+# tespit -> mod -> kanvas akışından geçer; her işçi süreç tek bir HandDetector
+# kullanır. Sonuçta her video için son kanvas, işlenmiş video ve tüm videolar
+# için bir hız özeti (summary.csv) kaydedilir.
+# -----------------------------------------------------------------
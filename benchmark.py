@@ -0,0 +1,104 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import argparse
+import time
+
+import numpy as np
+from config import settings
+from core.detector_backend import create_hand_detector
+from core.engine import AirDrawEngine
+from core.frame_source import create_frame_source
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def run_benchmark(detector, frames, width, height, frame_source=None, fps=settings.FPS_LIMIT):
+    engine = AirDrawEngine(width, height, hand_detector=detector)
+    blank = np.zeros((height, width, 3), dtype=np.uint8)
+
+    detect_time = 0.0
+    update_time = 0.0
+    count = 0
+    start_time = time.perf_counter()
+    try:
+        for frame_idx in range(frames):
+            if frame_source is not None:
+                success, frame = frame_source.read()
+                if not success:
+                    break
+                timestamp = frame_source.last_timestamp
+            else:
+                frame = blank
+                timestamp = frame_idx / fps
+
+            frame = engine.prepare(frame)
+            t0 = time.perf_counter()
+            frame, results = engine.detect(frame, timestamp)
+            t1 = time.perf_counter()
+            engine.update(frame, results, timestamp)
+            t2 = time.perf_counter()
+
+            detect_time += t1 - t0
+            update_time += t2 - t1
+            count += 1
+    finally:
+        engine.close()
+
+    wall_time = time.perf_counter() - start_time
+    return {
+        "frames": count,
+        "fps": count / wall_time if wall_time > 0 else 0.0,
+        "detect_ms": detect_time / count * 1000 if count else 0.0,
+        "update_ms": update_time / count * 1000 if count else 0.0,
+        "wall_time": wall_time
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="AirDraw motor performans ölçümü")
+    parser.add_argument("--backend", choices=["mediapipe", "replay", "synthetic"], default="synthetic",
+                        help="El tespit arka ucu")
+    parser.add_argument("--landmarks", default=None, help="replay arka ucu için landmark kaydı (.npz)")
+    parser.add_argument("--source", default=None, help="Kareler için video dosyası ya da görüntü klasörü")
+    parser.add_argument("--frames", type=int, default=2000, help="Ölçülecek kare sayısı")
+    parser.add_argument("--width", type=int, default=settings.CAMERA_WIDTH)
+    parser.add_argument("--height", type=int, default=settings.CAMERA_HEIGHT)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    detector = create_hand_detector(args.backend, landmarks_file=args.landmarks)
+
+    frame_source = None
+    width, height = args.width, args.height
+    if args.source is not None:
+        frame_source = create_frame_source(args.source, realtime=False).start()
+        width, height = frame_source.width, frame_source.height
+
+    try:
+        stats = run_benchmark(detector, args.frames, width, height, frame_source)
+    finally:
+        if frame_source is not None:
+            frame_source.release()
+        detector.close()
+
+    frame_ms = stats["detect_ms"] + stats["update_ms"]
+    share = stats["detect_ms"] / frame_ms * 100 if frame_ms > 0 else 0.0
+    logger.info(
+        f"{stats['frames']} kare, {stats['fps']:.0f} FPS | tespit {stats['detect_ms']:.2f} ms (%{share:.0f}), "
+        f"mod+kanvas {stats['update_ms']:.2f} ms"
+    )
+
+if __name__ == "__main__":
+    main()
+
+# -----------------------------------------------------------------
+# Motorun performansını pencere açmadan ölçer. Varsayılan olarak yapay el
+# (synthetic) ya da kaydedilmiş landmark'larla (replay) çalışır; böylece
+# kanvas, modlar ve birleştirme çıkarımdan bağımsız ölçülür. Her kare için
+# tespite ve kendi kodumuza (mod + kanvas + birleştirme) giden süre ayrı
+# raporlanır. mediapipe arka ucu ile --source verilirse çıkarım payı görülür.
+# -----------------------------------------------------------------
@@ -9,6 +9,11 @@ import os
 CAMERA_WIDTH = 1280  
 CAMERA_HEIGHT = 720  
 CAMERA_DEVICE = 1  
+CAMERA_BUFFER_SIZE = 3
+
+FRAME_SOURCE = None
+REPLAY_REALTIME = True
+IMAGE_SEQUENCE_FPS = 30
 
 DEFAULT_PEN_COLOR = (0, 0, 255)  
 DEFAULT_PEN_THICKNESS = 5  
@@ -23,12 +28,67 @@ MAX_FONT_SCALE = 3.0
 MAX_HANDS = 2  
 DETECTION_CONFIDENCE = 0.5  
 TRACKING_CONFIDENCE = 0.5  
+DETECTION_SCALE = 1.0
+DETECTION_INTERVAL = 1
+PREDICTION_MIN_CONFIDENCE = 0.5
+PREDICTION_MAX_DISPLACEMENT = 0.1
+
+ROI_TRACKING = False
+ROI_PADDING = 0.5
+ROI_MIN_SIZE = 192
+ROI_INPUT_SIZE = 256
+ROI_FULL_SEARCH_INTERVAL = 30
+
+MOTION_GATING = False
+MOTION_THRESHOLD = 2.0
+MOTION_DOWNSAMPLE = 8
+MOTION_MAX_SKIP = 15
+
+DETECTOR_BACKEND = "mediapipe"
+REPLAY_LANDMARKS_FILE = None
+RECORD_LANDMARKS_FILE = None
+DETECTOR_PROCESS = False
+DETECTOR_WORKERS = 1
+
+LANDMARK_SMOOTHING = False
+SMOOTHING_MIN_CUTOFF = 1.5
+SMOOTHING_BETA = 10.0
+SMOOTHING_D_CUTOFF = 1.0
 
 CANVAS_OPACITY = 0.5  
 CANVAS_COLOR = (255, 255, 255)  
+CANVAS_TILE_SIZE = 64
+INFINITE_CANVAS = False
+INFINITE_CACHE_TILES = 512
+TILE_SPILL_DIRECTORY = None
+PAN_STEP = 256
+ZOOM_LEVELS = (0.25, 0.5, 1.0, 2.0)
+MAX_HISTORY = 500
+HISTORY_BUDGET_MB = 64
+HISTORY_KEEP_RAW = 4
 
 FPS_LIMIT = 30  
 DEBUG_MODE = True  
+SKELETON_STYLE = "full"
+
+FRAME_PACING = True
+PACER_SPIN_MARGIN = 0.002
+IDLE_TIMEOUT = 10.0
+IDLE_FPS = 5
+
+ADAPTIVE_QUALITY = False
+QUALITY_LEVELS = [
+    {"model_complexity": 1, "detection_scale": 0.75, "detection_interval": 1, "draw_landmarks": True},
+    {"model_complexity": 0, "detection_scale": 0.75, "detection_interval": 1, "draw_landmarks": True},
+    {"model_complexity": 0, "detection_scale": 0.5, "detection_interval": 2, "draw_landmarks": True},
+    {"model_complexity": 0, "detection_scale": 0.5, "detection_interval": 3, "draw_landmarks": False}
+]
+
+PIPELINED_RUNTIME = False
+PIPELINE_QUEUE_SIZE = 2
+
+MULTI_SESSION_SINK = "tile"
+MULTI_TILE_WIDTH = 640
 
 DEFAULT_ERASER_SIZE = 40  
 
@@ -44,10 +104,12 @@ KEY_THICKNESS_DECREASE = ord('-')
 KEY_ERASER_SIZE_INCREASE = ord('=')  
 KEY_ERASER_SIZE_DECREASE = ord('-')  
 
+SAVE_SCALE = 1.0
 SAVE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(__file__)), "saved_drawings")  
 
 STATUS_TEXT = "İşaret parmağıyla çizim yap"  
 STATUS_NO_HAND = "El tespit edilemedi"  
+STATUS_VIEW_LOCKED = "Genel bakış: çizim için 1x'e dönün"
 STATUS_ERASER = "Silgi Modu: İşaret ve orta parmak ile sil"  
 STATUS_ERASER_OFF = "Silgi: Silmek için yüzük parmağını kapat"  
 STATUS_GESTURE = "Hareket Modu: El hareketleri ile kontrol et"  
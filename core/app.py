@@ -8,53 +8,44 @@ https://www.linkedin.com/in/batuhanfy/
 
 import cv2
 import time
-import numpy as np
 from config import settings
 from utils.logger import get_logger
 from utils.fps_counter import FPSCounter
-from core.hand_detector import HandDetector
-from core.canvas import Canvas
-from modes.drawing_mode import DrawingMode
-from modes.eraser_mode import EraserMode
-from modes.text_mode import TextMode
-from modes.gesture_mode import GestureMode
-from modes.selection_mode import SelectionMode
+from core.frame_source import create_frame_source
+from core.engine import AirDrawEngine
+from core.pipeline import FramePipeline
+from core.quality_governor import QualityGovernor
+from core.scheduler import FramePacer, IdleScheduler
 
 logger = get_logger(__name__)
 
 class AirDrawApp:
-    def __init__(self):
+    def __init__(self, source=None, realtime=settings.REPLAY_REALTIME, hand_detector=None):
         logger.info("AirDraw uygulaması başlatılıyor...")
         
-        self.cap = cv2.VideoCapture(settings.CAMERA_DEVICE)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings.CAMERA_WIDTH)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings.CAMERA_HEIGHT)
+        self.frame_source = create_frame_source(source, realtime=realtime)
         
-        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.width = self.frame_source.width
+        self.height = self.frame_source.height
         
-        logger.info(f"Kamera boyutları: {self.width}x{self.height}")
+        logger.info(f"Görüntü boyutları: {self.width}x{self.height}")
         
-        self.hand_detector = HandDetector(
-            static_mode=False,
-            max_hands=settings.MAX_HANDS,
-            detection_confidence=settings.DETECTION_CONFIDENCE,
-            tracking_confidence=settings.TRACKING_CONFIDENCE
-        )
-        
-        self.canvas = Canvas(width=self.width, height=self.height)
+        self.engine = AirDrawEngine(self.width, self.height, hand_detector=hand_detector)
+        self.hand_detector = self.engine.hand_detector
+        self.canvas = self.engine.canvas
+        self.modes = self.engine.modes
         self.fps_counter = FPSCounter()
+        self.governor = QualityGovernor(self.engine) if settings.ADAPTIVE_QUALITY else None
         
-        self.modes = [
-            DrawingMode(self),
-            EraserMode(self),
-            TextMode(self),
-            SelectionMode(self),
-            GestureMode(self)
-        ]
-        self.current_mode_idx = 0
-        self.current_mode = self.modes[self.current_mode_idx]
+        # Hızlı tekrar oynatmada (realtime=False) hız sınırı uygulanmaz
+        self.pacer = None
+        self.idle_scheduler = None
+        if settings.FRAME_PACING and realtime:
+            self.pacer = FramePacer(settings.FPS_LIMIT)
+            self.idle_scheduler = IdleScheduler(self.pacer, self.frame_source)
         
+        self.pipeline = None
+        self.process_time = 0.0
         self.running = False
         self.show_help = False
         self.show_debug = settings.DEBUG_MODE
@@ -64,95 +55,115 @@ class AirDrawApp:
     def run(self):
         self.running = True
         logger.info("Uygulama çalışmaya başladı")
+        self.frame_source.start()
         
+        if settings.PIPELINED_RUNTIME:
+            self.pipeline = FramePipeline(self, queue_size=settings.PIPELINE_QUEUE_SIZE)
+            self.pipeline.run()
+        else:
+            self._run_serial()
+                
+        self.frame_source.release()
+        self.hand_detector.close()
+        self.engine.close()
+        cv2.destroyAllWindows()
+        logger.info("Uygulama sonlandırıldı")
+    
+    def _run_serial(self):
+        keys = ()
         while self.running:
-            success, frame = self.cap.read()
+            success, frame = self.frame_source.read()
             if not success:
-                logger.error("Kameradan görüntü alınamadı!")
+                self._log_source_end()
                 break
             
-            frame = cv2.flip(frame, 1)
-            frame, results = self.hand_detector.find_hands(frame, draw=True)
-            
-            overlay = frame.copy()
-            alpha = settings.CANVAS_OPACITY
-            cv2.addWeighted(self.canvas.canvas, alpha, overlay, 1 - alpha, 0, overlay)
-            frame = overlay
-            
-            status_text = settings.STATUS_NO_HAND
-            status_color = (0, 0, 255)
-            active_mode = None
-            
-            if results.multi_hand_landmarks:
-                for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                    if hand_idx >= settings.MAX_HANDS:
-                        break
-                    
-                    for mode in self.modes:
-                        if mode.check_activation(hand_landmarks, self.width, self.height):
-                            active_mode = mode
-                            frame, status_text, status_color = mode.process(
-                                frame,
-                                hand_landmarks,
-                                self.width,
-                                self.height
-                            )
-                            break
+            start_time = time.perf_counter()
+            result = self.engine.step(frame, self.frame_source.last_timestamp, keys)
+            self._record_process_time(time.perf_counter() - start_time)
+            self.update_idle(result.results)
             
-            if active_mode and active_mode != self.current_mode:
-                self.current_mode.reset()
-                self.current_mode = active_mode
-                self.current_mode_idx = self.modes.index(active_mode)
-                logger.debug(f"Mod değiştirildi: {self.current_mode.name}")
+            fps = self.update_fps()
+            frame = self.compose_stage(result.frame, fps, result.mode)
             
-            fps = self.fps_counter.update()
-            
-            if self.show_debug:
-                cv2.putText(
-                    frame,
-                    f"FPS: {int(fps)}",
-                    (10, 30),
-                    cv2.FONT_HERSHEY_PLAIN,
-                    2,
-                    (255, 0, 255),
-                    2
-                )
-                
-                mode_text = f"Mod: {self.current_mode.name}"
-                cv2.putText(
-                    frame,
-                    mode_text,
-                    (10, 70),
-                    cv2.FONT_HERSHEY_PLAIN,
-                    2,
-                    self.current_mode.status_color,
-                    2
-                )
+            cv2.imshow("AirDraw", frame)
+            key = cv2.waitKey(1)
+            keys = () if self._handle_key_press(key) else (key,)
             
+            if self.pacer is not None:
+                self.pacer.wait()
+    
+    def _log_source_end(self):
+        if self.frame_source.is_live:
+            logger.error("Kameradan görüntü alınamadı!")
+        else:
+            logger.info(f"Kayıt sona erdi ({self.frame_source.frames_read} kare)")
+    
+    def update_fps(self):
+        fps = self.fps_counter.update()
+        if self.governor is not None:
+            # Kare süresi kamera hızına ve uykuya bağlıdır; yönetici sadece tespit + güncelleme
+            # süresine bakar. Boru hattında en yavaş aşamanın süresi belirleyicidir
+            if self.pipeline is not None:
+                frame_time = self.pipeline.bottleneck_time()
+            else:
+                frame_time = self.process_time
+            self.governor.update(frame_time)
+        return fps
+    
+    def _record_process_time(self, elapsed, smoothing=0.1):
+        if self.process_time == 0:
+            self.process_time = elapsed
+        else:
+            self.process_time += smoothing * (elapsed - self.process_time)
+    
+    def update_idle(self, results):
+        if self.idle_scheduler is not None:
+            self.idle_scheduler.update(bool(results.multi_hand_landmarks))
+    
+    def compose_stage(self, frame, fps, mode, queue_depths=None):
+        if self.show_debug:
             cv2.putText(
                 frame,
-                status_text,
-                (10, self.height - 20),
+                f"FPS: {int(fps)}  Tespit: {self.hand_detector.detect_time * 1000:.1f} ms",
+                (10, 30),
                 cv2.FONT_HERSHEY_PLAIN,
                 2,
-                status_color,
+                (255, 0, 255),
                 2
             )
             
-            if self.show_help:
-                self._draw_help_screen(frame)
+            mode_text = f"Mod: {mode.name}"
+            cv2.putText(
+                frame,
+                mode_text,
+                (10, 70),
+                cv2.FONT_HERSHEY_PLAIN,
+                2,
+                mode.status_color,
+                2
+            )
             
-            cv2.imshow("AirDraw", frame)
-            key = cv2.waitKey(1)
-            self._handle_key_press(key)
-                
-        self.cap.release()
-        cv2.destroyAllWindows()
-        logger.info("Uygulama sonlandırıldı")
+            if queue_depths:
+                queue_text = "Kuyruk: " + " ".join(f"{name}={depth}" for name, depth in queue_depths.items())
+                cv2.putText(
+                    frame,
+                    queue_text,
+                    (10, 110),
+                    cv2.FONT_HERSHEY_PLAIN,
+                    1.5,
+                    (255, 0, 255),
+                    2
+                )
+        
+        if self.show_help:
+            self._draw_help_screen(frame)
+        
+        return frame
     
     def _handle_key_press(self, key):
+        # Pencereye ait tuşlar burada, kanvas ve mod tuşları motorda işlenir
         if key == -1:
-            return
+            return True
             
         if key == 27:
             logger.info("Uygulama sonlandırılıyor...")
@@ -161,30 +172,13 @@ class AirDrawApp:
             self.show_help = not self.show_help
         elif key == ord('d'):
             self.show_debug = not self.show_debug
-        elif key == ord('c'):
-            self.canvas.clear()
-            logger.info("Kanvas temizlendi")
-        elif key == ord('s'):
-            file_path = self.canvas.save_drawing()
-            if file_path:
-                logger.info(f"Çizim kaydedildi: {file_path}")
-        elif key == ord('z'):
-            if self.canvas.undo():
-                logger.info("Son işlem geri alındı")
-        elif key == ord('y'):
-            if self.canvas.redo():
-                logger.info("İşlem yeniden yapıldı")
-        elif key == ord('m'):
-            self.next_mode()
-        elif key == ord('n'):
-            self.prev_mode()
         else:
-            self.current_mode.handle_key_press(key)
+            return False
+        return True
     
     def _draw_help_screen(self, frame):
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (self.width, self.height), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        # Siyah katmanla %70 karıştırmak kareyi 0.3 ile ölçeklemekle aynıdır, kopya gerekmez
+        cv2.convertScaleAbs(frame, frame, 0.3)
         
         cv2.putText(
             frame,
@@ -208,6 +202,7 @@ class AirDrawApp:
             "N: Önceki mod",
             "P: Renk değiştir",
             "+/-: Kalem/Silgi boyutu",
+            "I/J/K/L: Kaydır, U/O: Uzaklaş/Yakınlaş" if self.engine.infinite_canvas else "",
             "",
             "Modlar:",
             "- İşaret parmağı: Çizim modu",
@@ -227,18 +222,6 @@ class AirDrawApp:
                 (255, 255, 255),
                 1
             )
-    
-    def next_mode(self):
-        self.current_mode.reset()
-        self.current_mode_idx = (self.current_mode_idx + 1) % len(self.modes)
-        self.current_mode = self.modes[self.current_mode_idx]
-        logger.info(f"Mod değiştirildi: {self.current_mode.name}")
-    
-    def prev_mode(self):
-        self.current_mode.reset()
-        self.current_mode_idx = (self.current_mode_idx - 1) % len(self.modes)
-        self.current_mode = self.modes[self.current_mode_idx]
-        logger.info(f"Mod değiştirildi: {self.current_mode.name}")
 
 """
 Bu kod, el hareketleriyle çizim yapmayı sağlayan bir uygulamanın ana sınıfıdır. 
@@ -9,6 +9,9 @@ import numpy as np
 import os  
 import datetime  
 from config import settings  
+from core.history_store import HistoryStore
+from core.tile_grid import TileGrid
+from core.stroke_document import StrokeDocument
 
 class Canvas:  
     def __init__(self, width=800, height=600):  
@@ -29,29 +32,119 @@ class Canvas:
             (255, 255, 255)   
         ]  
         self.current_color_idx = 0  
-        self.history = []  
-        self.history_idx = -1  
-        self.max_history = 20  
-        self.save_to_history()  
+        
+        # Geçmişte tüm kare yerine sadece değişen bölgenin yaması tutulur
+        self.history = HistoryStore()
+        self.tiles = TileGrid(width, height)
+        self.tile_size = self.tiles.tile_size
+        self.stroke_tiles = None
+        self.stroke_bounds = None
+        
+        # Çizimlerin vektör kaydı; kanvas dizisi bunun önbelleğidir
+        self.document = StrokeDocument()
+        # Geçmişten düşüp belgede tabana indirgenen kayıt sayısı
+        self.flattened = 0
+        # Görünümün sol üst köşesinin dünya koordinatı (sabit kanvasta hep sıfır)
+        self.origin = (0, 0)
+    
+    @property
+    def editable(self):
+        return True
+    
+    def _world(self, point):
+        return (int(point[0]) + self.origin[0], int(point[1]) + self.origin[1])
     
     def clear(self):  
-        self.canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)  
-        self.save_to_history()  
+        self.commit_stroke()
+        if not self.canvas.any():
+            return
+        self._begin_edit(0, 0, self.width, self.height)
+        self.canvas.fill(0)
+        self.document.add_clear()
+        self.commit_stroke()
     
     def resize(self, width, height):  
-        new_canvas = np.zeros((height, width, 3), dtype=np.uint8)  
-        h = min(self.height, height)  
-        w = min(self.width, width)  
-        new_canvas[:h, :w] = self.canvas[:h, :w]  
-        self.canvas = new_canvas  
+        self.commit_stroke()
+        # Kanvas kırpılmak yerine belgeden yeni boyutta yeniden çizilir
+        self.canvas = self.document.rasterize(width, height, origin=self.origin)
         self.width = width  
         self.height = height  
-        self.save_to_history()  
+        self.tiles = TileGrid(width, height, self.tile_size)
+        self.tiles.mark_all()
+        # Yamalar eski boyuta göre olduğu için geçmiş sıfırlanır; geri alınamayan gruplar tabana iner
+        self.history.clear()
+        del self.document.groups[self.document.cursor:]
+        self.document.flatten(self.document.cursor, width, height, self.origin)
+        self.flattened = self.history.evicted
     
-    def draw_line(self, point1, point2):  
+    def draw_line(self, point1, point2, timestamp=None):  
+        # Serbest çizgi açık bir vuruşa eklenir; vuruş commit_stroke ile tek geri alma adımı olur
+        pad = self.pen_thickness // 2 + 2
+        self._begin_edit(
+            min(point1[0], point2[0]) - pad,
+            min(point1[1], point2[1]) - pad,
+            max(point1[0], point2[0]) + pad + 1,
+            max(point1[1], point2[1]) + pad + 1
+        )
         cv2.line(self.canvas, point1, point2, self.pen_color, self.pen_thickness)  
+        self.document.add_line(self._world(point1), self._world(point2), self.pen_color, self.pen_thickness, timestamp)
+    
+    def erase_line(self, point1, point2, size, timestamp=None):
+        pad = size + 2
+        self._begin_edit(
+            min(point1[0], point2[0]) - pad,
+            min(point1[1], point2[1]) - pad,
+            max(point1[0], point2[0]) + pad + 1,
+            max(point1[1], point2[1]) + pad + 1
+        )
+        cv2.line(self.canvas, point1, point2, (0, 0, 0), size * 2)
+        cv2.circle(self.canvas, point2, size, (0, 0, 0), -1)
+        self.document.add_line(self._world(point1), self._world(point2), (0, 0, 0), size * 2, timestamp, erase=True)
+    
+    def fill_rect(self, point1, point2, color=(0, 0, 0)):
+        started = self._begin_edit(
+            min(point1[0], point2[0]),
+            min(point1[1], point2[1]),
+            max(point1[0], point2[0]) + 1,
+            max(point1[1], point2[1]) + 1
+        )
+        cv2.rectangle(self.canvas, point1, point2, color, -1)
+        self.document.add_shape("rectangle", self._world(point1) + self._world(point2), color, -1)
+        if started:
+            self.commit_stroke()
+    
+    def paste(self, image, position, mask=None):
+        # Kanvas dışına taşan kısım kırpılır
+        x1, y1 = max(0, position[0]), max(0, position[1])
+        x2 = min(self.width, position[0] + image.shape[1])
+        y2 = min(self.height, position[1] + image.shape[0])
+        if x1 >= x2 or y1 >= y2:
+            return
+        image = image[y1 - position[1]:y2 - position[1], x1 - position[0]:x2 - position[0]]
+        if mask is not None:
+            mask = mask[y1 - position[1]:y2 - position[1], x1 - position[0]:x2 - position[0]]
+        
+        started = self._begin_edit(x1, y1, x2, y2)
+        region = self.canvas[y1:y2, x1:x2]
+        if mask is None:
+            region[...] = image
+        else:
+            region[mask] = image[mask]
+        self.document.add_paste(self._world((x1, y1)), image, mask)
+        if started:
+            self.commit_stroke()
     
     def draw_text(self, text, position):  
+        (text_width, text_height), baseline = cv2.getTextSize(
+            text, cv2.FONT_HERSHEY_SIMPLEX, self.font_scale, self.font_thickness
+        )
+        pad = self.font_thickness + 2
+        started = self._begin_edit(
+            position[0] - pad,
+            position[1] - text_height - pad,
+            position[0] + text_width + pad,
+            position[1] + baseline + pad
+        )
         cv2.putText(  
             self.canvas,  
             text,  
@@ -61,10 +154,19 @@ class Canvas:
             self.pen_color,  
             self.font_thickness  
         )  
-        self.save_to_history()  
+        self.document.add_text(text, self._world(position), self.pen_color, self.font_scale, self.font_thickness)
+        if started:
+            self.commit_stroke()
     
     def draw_rectangle(self, point1, point2, filled=False):  
         thickness = -1 if filled else self.pen_thickness  
+        pad = self.pen_thickness // 2 + 2
+        started = self._begin_edit(
+            min(point1[0], point2[0]) - pad,
+            min(point1[1], point2[1]) - pad,
+            max(point1[0], point2[0]) + pad + 1,
+            max(point1[1], point2[1]) + pad + 1
+        )
         cv2.rectangle(  
             self.canvas,  
             point1,  
@@ -72,10 +174,19 @@ class Canvas:
             self.pen_color,  
             thickness  
         )  
-        self.save_to_history()  
+        self.document.add_shape("rectangle", self._world(point1) + self._world(point2), self.pen_color, thickness)
+        if started:
+            self.commit_stroke()
     
     def draw_circle(self, center, radius, filled=False):  
         thickness = -1 if filled else self.pen_thickness  
+        pad = radius + self.pen_thickness // 2 + 2
+        started = self._begin_edit(
+            center[0] - pad,
+            center[1] - pad,
+            center[0] + pad + 1,
+            center[1] + pad + 1
+        )
         cv2.circle(  
             self.canvas,  
             center,  
@@ -83,7 +194,9 @@ class Canvas:
             self.pen_color,  
             thickness  
         )  
-        self.save_to_history()  
+        self.document.add_shape("circle", self._world(center) + (radius,), self.pen_color, thickness)
+        if started:
+            self.commit_stroke()
         
     def cycle_color(self):  
         self.current_color_idx = (self.current_color_idx + 1) % len(self.color_palette)  
@@ -101,41 +214,147 @@ class Canvas:
     def decrease_font_scale(self):  
         self.font_scale = max(self.font_scale - 0.1, settings.MIN_FONT_SCALE)  
     
-    def save_drawing(self):  
+    def save_drawing(self, scale=settings.SAVE_SCALE):  
         try:  
             if not os.path.exists(settings.SAVE_DIRECTORY):  
                 os.makedirs(settings.SAVE_DIRECTORY)  
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")  
             file_path = os.path.join(settings.SAVE_DIRECTORY, f"drawing_{timestamp}.png")  
-            cv2.imwrite(file_path, self.canvas)  
+            if scale != 1.0:
+                image = self._render_scaled(scale)
+            else:
+                image = self.canvas
+            cv2.imwrite(file_path, image)  
             return file_path  
         except Exception as e:  
             print(f"Kayıt hatası: {e}")  
             return None  
     
-    def save_to_history(self):  
-        if self.history_idx < len(self.history) - 1:  
-            self.history = self.history[:self.history_idx + 1]  
-        self.history.append(self.canvas.copy())  
-        self.history_idx = len(self.history) - 1  
-        if len(self.history) > self.max_history:  
-            self.history.pop(0)  
-            self.history_idx -= 1  
+    def _render_scaled(self, scale):
+        # Yüksek çözünürlüklü kayıt kanvastan büyütülmez, belgeden yeniden çizilir
+        return self.document.rasterize(int(self.width * scale), int(self.height * scale), scale, self.origin)
+    
+    def begin_stroke(self):
+        if self.stroke_tiles is None:
+            self.stroke_tiles = {}
+            self.stroke_bounds = None
+    
+    def _begin_edit(self, x1, y1, x2, y2):
+        started = self.stroke_tiles is None
+        self.begin_stroke()
+        self._mark_dirty(x1, y1, x2, y2)
+        return started
+    
+    def _mark_dirty(self, x1, y1, x2, y2):
+        x1 = max(0, int(x1))
+        y1 = max(0, int(y1))
+        x2 = min(self.width, int(x2))
+        y2 = min(self.height, int(y2))
+        if x1 >= x2 or y1 >= y2:
+            return
+        
+        if self.stroke_bounds is None:
+            self.stroke_bounds = [x1, y1, x2, y2]
+        else:
+            bounds = self.stroke_bounds
+            bounds[0] = min(bounds[0], x1)
+            bounds[1] = min(bounds[1], y1)
+            bounds[2] = max(bounds[2], x2)
+            bounds[3] = max(bounds[3], y2)
+        self.tiles.mark(x1, y1, x2, y2)
+        
+        # Vuruşta ilk kez dokunulan karoların çizimden önceki hali saklanır
+        size = self.tile_size
+        row1, row2, col1, col2 = self.tiles.tile_range(x1, y1, x2, y2)
+        for row in range(row1, row2):
+            for col in range(col1, col2):
+                if (row, col) not in self.stroke_tiles:
+                    self.stroke_tiles[(row, col)] = self.canvas[
+                        row * size:(row + 1) * size, col * size:(col + 1) * size
+                    ].copy()
+    
+    def commit_stroke(self):
+        tiles, bounds = self.stroke_tiles, self.stroke_bounds
+        self.stroke_tiles = None
+        self.stroke_bounds = None
+        if not tiles or bounds is None:
+            self.document.discard()
+            return False
+        
+        # Kirli dikdörtgenin önceki hali yedeklenen karolardan birleştirilir
+        x1, y1, x2, y2 = bounds
+        patch = self.canvas[y1:y2, x1:x2].copy()
+        size = self.tile_size
+        for (row, col), backup in tiles.items():
+            top, left = row * size, col * size
+            ix1, iy1 = max(left, x1), max(top, y1)
+            ix2, iy2 = min(left + backup.shape[1], x2), min(top + backup.shape[0], y2)
+            if ix1 < ix2 and iy1 < iy2:
+                patch[iy1 - y1:iy2 - y1, ix1 - x1:ix2 - x1] = backup[iy1 - top:iy2 - top, ix1 - left:ix2 - left]
+        
+        if np.array_equal(patch, self.canvas[y1:y2, x1:x2]):
+            self.document.discard()
+            return False
+        
+        # Belge grupları geçmiş kayıtlarıyla birebir eşleşir ve boyutları geçmiş bütçesine sayılır
+        self.history.push((x1, y1, x2, y2), patch, self.document.open_nbytes)
+        self.document.commit()
+        self._flatten_evicted()
+        return True
+    
+    def _flatten_evicted(self):
+        # Geçmişten düşen kayıtlar (sıkıştırma iş parçacığında da olabilir) belgede tabana indirgenir
+        evicted = self.history.evicted
+        if evicted > self.flattened:
+            self.document.flatten(evicted - self.flattened, self.width, self.height, self.origin)
+            self.flattened = evicted
     
     def undo(self):  
-        if self.history_idx > 0:  
-            self.history_idx -= 1  
-            self.canvas = self.history[self.history_idx].copy()  
-            return True  
-        return False  
+        self.commit_stroke()
+        bounds = self.history.undo(self.canvas)
+        if bounds is None:
+            return False
+        self.tiles.mark(*bounds)
+        self.document.undo()
+        self._flatten_evicted()
+        return True
     
     def redo(self):  
-        if self.history_idx < len(self.history) - 1:  
-            self.history_idx += 1  
-            self.canvas = self.history[self.history_idx].copy()  
-            return True  
-        return False  
+        self.commit_stroke()
+        bounds = self.history.redo(self.canvas)
+        if bounds is None:
+            return False
+        self.tiles.mark(*bounds)
+        self.document.redo()
+        self._flatten_evicted()
+        return True
+    
+    def composite(self, frame, alpha):
+        # Çizim olmayan karolarda kanvas siyahtır; orada karıştırma yalnızca ölçeklemeye iner
+        self.tiles.update_ink(self.canvas)
+        bounds = self.tiles.ink_bounds()
+        if bounds is None:
+            cv2.convertScaleAbs(frame, frame, 1 - alpha)
+            return frame
+        
+        x1, y1, x2, y2 = bounds
+        cv2.addWeighted(self.canvas[y1:y2, x1:x2], alpha, frame[y1:y2, x1:x2], 1 - alpha, 0, frame[y1:y2, x1:x2])
+        for band in (frame[:y1], frame[y2:], frame[y1:y2, :x1], frame[y1:y2, x2:]):
+            if band.size:
+                cv2.convertScaleAbs(band, band, 1 - alpha)
+        return frame
+    
+    @property
+    def history_nbytes(self):
+        return self.history.nbytes
+    
+    def close(self):
+        self.history.close()
 
+# Geri alma geçmişi her düzenlemenin sadece değişen dikdörtgenini saklar.
+# Çizimler begin_stroke / commit_stroke arasında toplanır; dokunulan 64x64
+# karoların önceki hali vuruş boyunca bir kez yedeklenir, sonunda tek bir yama
+# oluşur. Serbest çizgi bir vuruş olarak tek adımda geri alınır.
 # -----------------------------------------------------------------  
 # Bu Canvas sınıfı, el hareketleriyle çizim yapabilen bir uygulamanın yine
 # temelini oluşturuyor. Çizim, silme, kaydetme, geri alma gibi işlemleri  
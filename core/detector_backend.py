@@ -0,0 +1,168 @@
+"""
+-------------
+Batuhan Korkmaz
+Full Stack Developer & EdTech Girişimcisi
+https://www.linkedin.com/in/batuhanfy/
+--------------
+"""
+
+import time
+from collections import deque
+import mediapipe as mp
+from config import settings
+from core.hand_state import INDEX, MIDDLE, RING, PINKY, ALL_FINGERS
+from utils.logger import get_logger
+from utils.skeleton_renderer import SkeletonRenderer
+
+logger = get_logger(__name__)
+
+class DetectorBackend:
+    def __init__(self, max_hands=2):
+        self.max_hands = max_hands
+
+        # Kalite yöneticisinin ayarladığı değerler; MediaPipe dışındaki arka uçlarda etkisizdir
+        self.model_complexity = None
+        self.detection_scale = 1.0
+        self.detection_interval = 1
+
+        self.mp_hands = mp.solutions.hands
+        self.renderer = SkeletonRenderer()
+
+        # submit/collect ile aynı anda işlenebilecek kare sayısı; senkron arka uçlarda 1
+        self.max_in_flight = 1
+        self.pending = deque()
+
+        self.recorder = None
+        self.detect_time = 0.0
+        self.total_detect_time = 0.0
+        self.frame_count = 0
+
+    def detect(self, frame, timestamp):
+        raise NotImplementedError
+
+    def find_hands(self, frame, draw=True, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+
+        # Kare süresinin ne kadarının tespite gittiği buradan ölçülür
+        start = time.perf_counter()
+        results = self.detect(frame, timestamp)
+        return self._finish(frame, results, timestamp, draw, start)
+
+    def submit(self, frame, timestamp=None):
+        self.pending.append((frame, timestamp))
+
+    def collect(self, draw=True):
+        frame, timestamp = self.pending.popleft()
+        return self.find_hands(frame, draw, timestamp)
+
+    def _finish(self, frame, results, timestamp, draw, start):
+        self.detect_time = time.perf_counter() - start
+        self.total_detect_time += self.detect_time
+        self.frame_count += 1
+
+        if self.recorder is not None:
+            self.recorder.record(results, timestamp)
+
+        if draw:
+            self.renderer.draw(frame, results)
+
+        return frame, results
+
+    def hint(self, results, timestamp):
+        # Başka bir dedektörün bulduğu el konumu; takip kullanan arka uçlar bunu dikkate alır
+        pass
+
+    def reset(self):
+        # Yeni bir kaynağa geçerken takip durumu temizlenir
+        pass
+
+    def set_model_complexity(self, model_complexity):
+        pass
+
+    def set_detection_interval(self, interval):
+        pass
+
+    def set_detection_scale(self, scale):
+        pass
+
+    def close(self):
+        if self.recorder is not None:
+            self.recorder.save()
+            self.recorder = None
+
+    def get_landmark_position(self, hand, width, height, landmark_idx):
+        return hand.position(landmark_idx)
+
+    def is_drawing_mode(self, hand):
+        return hand.fingers_match(INDEX, MIDDLE | RING | PINKY)
+
+    def is_text_mode(self, hand, width, height):
+        distance = hand.distance(self.mp_hands.HandLandmark.THUMB_TIP, self.mp_hands.HandLandmark.INDEX_FINGER_TIP)
+        return distance < 50 and hand.is_up(MIDDLE | RING | PINKY)
+
+    def is_gesture_mode(self, hand):
+        return hand.is_up(ALL_FINGERS)
+
+    def is_selection_mode(self, hand):
+        return hand.fingers_match(INDEX | MIDDLE | RING, PINKY)
+
+def create_hand_detector(backend=None, landmarks_file=None, record_file=None, out_of_process=None):
+    backend = backend or settings.DETECTOR_BACKEND
+    record_file = settings.RECORD_LANDMARKS_FILE if record_file is None else record_file
+    if out_of_process is None:
+        out_of_process = settings.DETECTOR_PROCESS or settings.DETECTOR_WORKERS > 1
+
+    if out_of_process:
+        # Çıkarım ayrı süreçte çalışır; bu süreçte yalnızca çizim ve kayıt yapılır
+        from core.process_detector import ProcessHandDetector
+        workers = settings.DETECTOR_WORKERS
+        if backend != "mediapipe" and workers > 1:
+            # Kayıt ve senaryo arka uçları sıralı durum tutar, kareleri bölüştürmek sırayı bozar
+            logger.warning(f"{backend} arka ucu tek işçiyle çalıştırılıyor")
+            workers = 1
+        detector = ProcessHandDetector(
+            backend,
+            landmarks_file,
+            max_hands=settings.MAX_HANDS,
+            workers=workers
+        )
+    elif backend == "mediapipe":
+        from core.hand_detector import HandDetector
+        detector = HandDetector(
+            static_mode=False,
+            max_hands=settings.MAX_HANDS,
+            detection_confidence=settings.DETECTION_CONFIDENCE,
+            tracking_confidence=settings.TRACKING_CONFIDENCE,
+            detection_scale=settings.DETECTION_SCALE,
+            detection_interval=settings.DETECTION_INTERVAL,
+            roi_tracking=settings.ROI_TRACKING,
+            motion_gating=settings.MOTION_GATING
+        )
+    elif backend == "replay":
+        from core.replay_backend import ReplayBackend
+        detector = ReplayBackend(landmarks_file or settings.REPLAY_LANDMARKS_FILE, max_hands=settings.MAX_HANDS)
+    elif backend == "synthetic":
+        from core.synthetic_backend import SyntheticBackend
+        detector = SyntheticBackend(max_hands=settings.MAX_HANDS)
+    else:
+        raise ValueError(f"Bilinmeyen tespit arka ucu: {backend}")
+
+    if record_file:
+        from core.replay_backend import LandmarkRecorder
+        detector.recorder = LandmarkRecorder(record_file)
+
+    mode_text = " (ayrı süreç)" if out_of_process else ""
+    logger.info(f"El tespit arka ucu: {backend}{mode_text}")
+    return detector
+
+"""
+El tespit arka uçları için ortak arayüz. Her arka uç detect(frame, timestamp)
+ile MediaPipe sonuçlarıyla aynı yapıda bir sonuç döndürür (multi_hand_landmarks,
+multi_handedness); motor bunu kare başına bir kez HandState'e çevirir.
+find_hands çizimi, kayıt almayı ve tespit süresinin ölçümünü tüm arka uçlar
+için aynı şekilde yapar. submit/collect ile kare gönderilip sonucu sonra
+alınabilir; senkron arka uçlarda bu find_hands ile aynıdır. Arka uçlar:
+"mediapipe" (HandDetector), "replay" (kaydedilmiş landmark dosyası) ve
+"synthetic" (senaryolu yapay el hareketi).
+"""
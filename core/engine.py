@@ -0,0 +1,224 @@
+"""
+-------------
+Batuhan Korkmaz
+Full Stack Developer & EdTech Girişimcisi
+https://www.linkedin.com/in/batuhanfy/
+--------------
+"""
+
+import cv2
+from config import settings
+from utils.logger import get_logger
+from utils.buffer_pool import BufferPool
+from core.detector_backend import create_hand_detector
+from core.canvas import Canvas
+from core.infinite_canvas import InfiniteCanvas
+from core.hand_state import hands_from_results
+from core.mode_dispatcher import ModeDispatcher
+from core.landmark_filter import LandmarkFilter
+from modes.drawing_mode import DrawingMode
+from modes.eraser_mode import EraserMode
+from modes.text_mode import TextMode
+from modes.gesture_mode import GestureMode
+from modes.selection_mode import SelectionMode
+
+logger = get_logger(__name__)
+
+# Sonsuz kanvasta görünümü kaydırma (PAN_STEP piksel) ve yakınlaştırma tuşları
+PAN_KEYS = {ord('i'): (0, -1), ord('k'): (0, 1), ord('j'): (-1, 0), ord('l'): (1, 0)}
+ZOOM_KEYS = {ord('u'): -1, ord('o'): 1}
+
+class EngineResult:
+    __slots__ = ("frame", "canvas", "status_text", "status_color", "results", "mode", "timestamp")
+
+    def __init__(self, frame, canvas, status_text, status_color, results, mode, timestamp):
+        self.frame = frame
+        self.canvas = canvas
+        self.status_text = status_text
+        self.status_color = status_color
+        self.results = results
+        self.mode = mode
+        self.timestamp = timestamp
+
+class AirDrawEngine:
+    def __init__(self, width, height, hand_detector=None, mirror=True):
+        self.width = width
+        self.height = height
+        self.mirror = mirror
+        self.draw_landmarks = True
+        self.timestamp = 0.0
+        self.hands = []
+
+        # step() sonucundaki kare bu havuzdan gelir ve sonraki karelerde tekrar kullanılır
+        self.buffer_pool = BufferPool(depth=2)
+
+        self.hand_detector = hand_detector or create_hand_detector()
+
+        # Titreme modlara ulaşmadan önce süzülür
+        self.landmark_filter = LandmarkFilter() if settings.LANDMARK_SMOOTHING else None
+
+        self.infinite_canvas = settings.INFINITE_CANVAS
+        if self.infinite_canvas:
+            self.canvas = InfiniteCanvas(width=self.width, height=self.height)
+        else:
+            self.canvas = Canvas(width=self.width, height=self.height)
+
+        # Modlar motoru "app" olarak görür: canvas, hand_detector, width/height ve mod geçişleri buradadır
+        self.modes = [
+            DrawingMode(self),
+            EraserMode(self),
+            TextMode(self),
+            SelectionMode(self),
+            GestureMode(self)
+        ]
+        self.current_mode_idx = 0
+        self.current_mode = self.modes[self.current_mode_idx]
+
+        # Mod seçimi modların sırasına değil, parmak maskesi tablosuna bağlıdır
+        self.dispatcher = ModeDispatcher()
+        for mode in self.modes:
+            self.dispatcher.register(mode)
+
+    def step(self, frame, timestamp, keys=()):
+        for key in keys:
+            self.handle_key(key)
+
+        frame = self.prepare(frame)
+        frame, results = self.detect(frame, timestamp)
+        frame, status_text, status_color = self.update(frame, results, timestamp)
+        return EngineResult(
+            frame,
+            self.canvas.canvas,
+            status_text,
+            status_color,
+            results,
+            self.current_mode,
+            timestamp
+        )
+
+    def prepare(self, frame):
+        dst = self.buffer_pool.get("frame", frame.shape, frame.dtype)
+        if self.mirror:
+            return cv2.flip(frame, 1, dst)
+        dst[...] = frame
+        return dst
+
+    def detect(self, frame, timestamp=None):
+        return self.hand_detector.find_hands(frame, draw=self.draw_landmarks, timestamp=timestamp)
+
+    def submit_detection(self, frame, timestamp=None):
+        self.hand_detector.submit(frame, timestamp)
+
+    def collect_detection(self):
+        return self.hand_detector.collect(draw=self.draw_landmarks)
+
+    def update(self, frame, results, timestamp):
+        self.timestamp = timestamp
+
+        self.canvas.composite(frame, settings.CANVAS_OPACITY)
+
+        status_text = settings.STATUS_NO_HAND
+        status_color = (0, 0, 255)
+        active_mode = None
+
+        # Her el kare başına bir kez diziye çevrilir; modlar aynı HandState'i paylaşır
+        self.hands = hands_from_results(results, self.width, self.height, settings.MAX_HANDS)
+        if self.landmark_filter is not None:
+            self.landmark_filter.apply(self.hands, timestamp)
+
+        # Genel bakış yakınlaştırmasında kanvas sadece görüntülenir, modlar çalışmaz
+        hands = self.hands if self.canvas.editable else []
+        if not self.canvas.editable:
+            status_text = f"{settings.STATUS_VIEW_LOCKED} ({self.canvas.zoom:g}x)"
+
+        for hand in hands:
+            mode = self.dispatcher.dispatch(hand, self.width, self.height)
+            if mode is not None:
+                if mode is not self.current_mode:
+                    # Önceki modun açık vuruşu yeni modun çizimiyle karışmadan kapatılır
+                    self.canvas.commit_stroke()
+                active_mode = mode
+                frame, status_text, status_color = mode.process(
+                    frame,
+                    hand,
+                    self.width,
+                    self.height
+                )
+
+        if active_mode is None:
+            # El kaybolunca ya da poz bozulunca süren çizgi tek geri alma adımı olur
+            self.canvas.commit_stroke()
+        elif active_mode != self.current_mode:
+            self.current_mode.reset()
+            self.current_mode = active_mode
+            self.current_mode_idx = self.modes.index(active_mode)
+            logger.debug(f"Mod değiştirildi: {self.current_mode.name}")
+
+        cv2.putText(
+            frame,
+            status_text,
+            (10, self.height - 20),
+            cv2.FONT_HERSHEY_PLAIN,
+            2,
+            status_color,
+            2
+        )
+
+        return frame, status_text, status_color
+
+    def handle_key(self, key):
+        if key == -1:
+            return False
+
+        if key == ord('c'):
+            self.canvas.clear()
+            logger.info("Kanvas temizlendi")
+        elif key == ord('s'):
+            file_path = self.canvas.save_drawing()
+            if file_path:
+                logger.info(f"Çizim kaydedildi: {file_path}")
+        elif key == ord('z'):
+            if self.canvas.undo():
+                logger.info("Son işlem geri alındı")
+        elif key == ord('y'):
+            if self.canvas.redo():
+                logger.info("İşlem yeniden yapıldı")
+        elif key == ord('m'):
+            self.next_mode()
+        elif key == ord('n'):
+            self.prev_mode()
+        elif self.infinite_canvas and key in PAN_KEYS:
+            dx, dy = PAN_KEYS[key]
+            self.canvas.pan(dx * settings.PAN_STEP, dy * settings.PAN_STEP)
+            # Modların son noktası eski görünüme aittir
+            self.current_mode.reset()
+        elif self.infinite_canvas and key in ZOOM_KEYS:
+            if self.canvas.zoom_step(ZOOM_KEYS[key]):
+                self.current_mode.reset()
+                logger.info(f"Yakınlaştırma: {self.canvas.zoom:g}x")
+        else:
+            return self.current_mode.handle_key_press(key)
+        return True
+
+    def next_mode(self):
+        self.current_mode.reset()
+        self.current_mode_idx = (self.current_mode_idx + 1) % len(self.modes)
+        self.current_mode = self.modes[self.current_mode_idx]
+        logger.info(f"Mod değiştirildi: {self.current_mode.name}")
+
+    def prev_mode(self):
+        self.current_mode.reset()
+        self.current_mode_idx = (self.current_mode_idx - 1) % len(self.modes)
+        self.current_mode = self.modes[self.current_mode_idx]
+        logger.info(f"Mod değiştirildi: {self.current_mode.name}")
+
+    def close(self):
+        self.canvas.close()
+
+"""
+Pencereden bağımsız (headless) AirDraw motoru. step(frame, timestamp, keys)
+kareyi aynalar, elleri tespit eder, modları çalıştırır ve kanvası karenin
+üzerine bindirir. Sonuçta hem birleştirilmiş kare hem de kanvas döner.
+cv2.imshow / waitKey yoktur; pencere katmanı (AirDrawApp) bu motorun
+kullanıcılarından sadece biridir, başka servislere de gömülebilir.
+"""
@@ -0,0 +1,197 @@
+"""
+-------------
+Batuhan Korkmaz
+Full Stack Developer & EdTech Girişimcisi
+https://www.linkedin.com/in/batuhanfy/
+--------------
+"""
+
+import cv2
+import os
+import time
+from config import settings
+from core.camera_manager import CameraManager
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+class FrameSource:
+    is_live = False
+
+    def __init__(self, realtime=True):
+        self.realtime = realtime
+        self.width = 0
+        self.height = 0
+        self.fps = 0
+        self.last_timestamp = 0.0
+        self.frames_read = 0
+
+        self._first_timestamp = None
+        self._start_time = None
+
+    def start(self):
+        return self
+
+    def read(self):
+        return False, None
+
+    def release(self):
+        pass
+
+    def set_max_rate(self, fps):
+        pass
+
+    def _pace(self, timestamp):
+        # Kayıt zamanına göre oynatılıyorsa karenin zamanı gelene kadar beklenir
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp
+            self._start_time = time.perf_counter()
+            return
+
+        if not self.realtime:
+            return
+
+        delay = (timestamp - self._first_timestamp) - (time.perf_counter() - self._start_time)
+        if delay > 0:
+            time.sleep(delay)
+
+class CameraSource(FrameSource):
+    is_live = True
+
+    def __init__(self, device=settings.CAMERA_DEVICE, width=settings.CAMERA_WIDTH,
+                 height=settings.CAMERA_HEIGHT, buffer_size=settings.CAMERA_BUFFER_SIZE):
+        super().__init__(realtime=True)
+        self.camera = CameraManager(device=device, width=width, height=height, buffer_size=buffer_size)
+        self.width = self.camera.width
+        self.height = self.camera.height
+        self.fps = int(self.camera.cap.get(cv2.CAP_PROP_FPS)) or settings.FPS_LIMIT
+
+    def start(self):
+        self.camera.start()
+        return self
+
+    def read(self):
+        success, frame = self.camera.read()
+        if success:
+            self.last_timestamp = self.camera.last_timestamp
+            self.frames_read += 1
+        return success, frame
+
+    def set_max_rate(self, fps):
+        self.camera.set_max_rate(fps)
+
+    def release(self):
+        self.camera.release()
+
+class VideoFileSource(FrameSource):
+    def __init__(self, path, realtime=True, loop=False):
+        super().__init__(realtime=realtime)
+        self.path = path
+        self.loop = loop
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise IOError(f"Video açılamadı: {path}")
+
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or settings.FPS_LIMIT
+        self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        self._frame_idx = 0
+        self._loop_offset = 0.0
+
+    def read(self):
+        success, frame = self.cap.read()
+        if not success and self.loop and self._frame_idx > 0:
+            self._loop_offset = self.last_timestamp + 1.0 / self.fps
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self._frame_idx = 0
+            success, frame = self.cap.read()
+        if not success:
+            return False, None
+
+        # Bazı kapsayıcılar zaman damgası vermez, o durumda kare sırasından hesaplanır
+        timestamp = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        if timestamp <= 0 and self._frame_idx > 0:
+            timestamp = self._frame_idx / self.fps
+        timestamp += self._loop_offset
+
+        self._frame_idx += 1
+        self.frames_read += 1
+        self._pace(timestamp)
+        self.last_timestamp = timestamp
+        return True, frame
+
+    def release(self):
+        self.cap.release()
+
+class ImageSequenceSource(FrameSource):
+    def __init__(self, directory, fps=settings.IMAGE_SEQUENCE_FPS, realtime=True, loop=False):
+        super().__init__(realtime=realtime)
+        self.directory = directory
+        self.loop = loop
+        self.fps = fps
+        self.files = sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        if not self.files:
+            raise IOError(f"Klasörde görüntü bulunamadı: {directory}")
+
+        self.timestamps = self._load_timestamps()
+
+        first = cv2.imread(self.files[0])
+        self.height, self.width = first.shape[:2]
+        self._frame_idx = 0
+        self._loop_offset = 0.0
+
+    def _load_timestamps(self):
+        # timestamps.txt varsa her satır bir karenin saniye cinsinden zamanıdır
+        path = os.path.join(self.directory, "timestamps.txt")
+        if not os.path.exists(path):
+            return [idx / self.fps for idx in range(len(self.files))]
+
+        with open(path, "r", encoding="utf-8") as f:
+            timestamps = [float(line) for line in f if line.strip()]
+        if len(timestamps) != len(self.files):
+            logger.warning(f"timestamps.txt kare sayısıyla uyuşmuyor, {self.fps} FPS kullanılacak")
+            return [idx / self.fps for idx in range(len(self.files))]
+        return timestamps
+
+    def read(self):
+        if self._frame_idx >= len(self.files):
+            if not self.loop:
+                return False, None
+            self._loop_offset = self.last_timestamp + 1.0 / self.fps
+            self._frame_idx = 0
+
+        frame = cv2.imread(self.files[self._frame_idx])
+        if frame is None:
+            logger.error(f"Görüntü okunamadı: {self.files[self._frame_idx]}")
+            return False, None
+
+        timestamp = self.timestamps[self._frame_idx] + self._loop_offset
+        self._frame_idx += 1
+        self.frames_read += 1
+        self._pace(timestamp)
+        self.last_timestamp = timestamp
+        return True, frame
+
+def create_frame_source(source=None, realtime=True, loop=False):
+    if source is None:
+        source = settings.FRAME_SOURCE if settings.FRAME_SOURCE is not None else settings.CAMERA_DEVICE
+
+    if isinstance(source, int) or str(source).isdigit():
+        return CameraSource(device=int(source))
+    if os.path.isdir(source):
+        return ImageSequenceSource(source, realtime=realtime, loop=loop)
+    return VideoFileSource(source, realtime=realtime, loop=loop)
+
+"""
+Görüntü kaynakları burada tanımlı: canlı kamera, video dosyası ve görüntü klasörü.
+Hepsi aynı read() arayüzünü kullanır, böylece uygulama kamera olmadan da
+kayıtlı videolarla çalıştırılabilir ve ölçülebilir. Dosya kaynakları kayıt
+zamanına göre (realtime=True) ya da olabildiğince hızlı oynatılabilir.
+"""
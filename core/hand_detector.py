@@ -5,94 +5,214 @@
 # -----------------------------------------------------------------  
 
 import cv2  
-import mediapipe as mp  
-import numpy as np  
-import time  
 from config import settings  
+from utils.buffer_pool import BufferPool
+from core.landmark_predictor import LandmarkPredictor
+from core.motion_gate import MotionGate
+from core.detector_backend import DetectorBackend
 
-class HandDetector:  
-    def __init__(self, static_mode=False, max_hands=2, model_complexity=1, detection_confidence=0.5, tracking_confidence=0.5):  
+class HandDetector(DetectorBackend):  
+    def __init__(self, static_mode=False, max_hands=2, model_complexity=1, detection_confidence=0.5, tracking_confidence=0.5,
+                 detection_scale=1.0, detection_interval=1, roi_tracking=False, motion_gating=False):  
+        super().__init__(max_hands)
         self.static_mode = static_mode  
-        self.max_hands = max_hands  
         self.model_complexity = model_complexity  
         self.detection_confidence = detection_confidence  
         self.tracking_confidence = tracking_confidence  
+        self.detection_scale = detection_scale
+        self.detection_interval = detection_interval
+        self.roi_tracking = roi_tracking
+        self.roi_padding = settings.ROI_PADDING
+        self.roi_min_size = settings.ROI_MIN_SIZE
+        self.roi_input_size = settings.ROI_INPUT_SIZE
+        self.roi_full_search_interval = settings.ROI_FULL_SEARCH_INTERVAL
         
-        self.mp_hands = mp.solutions.hands  
-        self.mp_drawing = mp.solutions.drawing_utils  
-        self.mp_drawing_styles = mp.solutions.drawing_styles  
+        self.hands = self._create_hands()
+        # Kırpılmış ROI girdileri ayrı bir izleyiciye gider; tek bir izleyici hem kare
+        # kırpma hem tam 16:9 kare görürse önceki el konumu yanlış koordinatta kalır
+        self.roi_hands = self._create_hands() if roi_tracking else None
+        self.pending_model_complexity = None
         
-        self.hands = self.mp_hands.Hands(  
+        self.buffer_pool = BufferPool()
+        
+        self.predictor = LandmarkPredictor(
+            min_confidence=settings.PREDICTION_MIN_CONFIDENCE,
+            max_displacement=settings.PREDICTION_MAX_DISPLACEMENT
+        )
+        self.frames_since_detection = 0
+        self.inference_count = 0
+        self.prediction_count = 0
+        self.roi_count = 0
+        self.frames_since_full_search = 0
+        self.last_roi = None
+        
+        self.motion_gate = MotionGate() if motion_gating else None
+        self.last_results = None
+        self.gated_count = 0
+    
+    def detect(self, frame, timestamp):
+        results = None
+        if self.detection_interval > 1 and self.frames_since_detection < self.detection_interval - 1:
+            results = self.predictor.predict(timestamp)
+            if results is not None:
+                self.frames_since_detection += 1
+                self.prediction_count += 1
+        
+        # Sahne son tespitten beri değişmediyse önceki sonuç tekrar kullanılır
+        if results is None and self.motion_gate is not None and self.last_results is not None:
+            if self.motion_gate.is_static(frame):
+                results = self.last_results
+                self.gated_count += 1
+        
+        if results is None:
+            results = self._detect(frame, timestamp)
+            self.last_results = results
+            if self.motion_gate is not None:
+                self.motion_gate.update_reference(frame, self._compute_roi(frame.shape, timestamp))
+        
+        return results
+    
+    def _create_hands(self):
+        return self.mp_hands.Hands(  
             static_image_mode=self.static_mode,  
             max_num_hands=self.max_hands,  
             model_complexity=self.model_complexity,  
             min_detection_confidence=self.detection_confidence,  
             min_tracking_confidence=self.tracking_confidence  
         )  
-        
-        self.fps_start_time = 0  
-        self.fps = 0  
-    
-    def find_hands(self, frame, draw=True):  
-        if time.time() - self.fps_start_time > 1:  
-            self.fps_start_time = time.time()  
-        
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)  
-        results = self.hands.process(rgb_frame)  
-        
-        if draw and results.multi_hand_landmarks:  
-            for hand_landmarks in results.multi_hand_landmarks:  
-                self.mp_drawing.draw_landmarks(  
-                    frame,  
-                    hand_landmarks,  
-                    self.mp_hands.HAND_CONNECTIONS,  
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),  
-                    self.mp_drawing_styles.get_default_hand_connections_style()  
-                )  
-                
-        return frame, results  
     
-    def get_landmark_position(self, hand_landmarks, width, height, landmark_idx):  
-        landmark = hand_landmarks.landmark[landmark_idx]  
-        x = int(landmark.x * width)  
-        y = int(landmark.y * height)  
-        return (x, y)  
+    def _detect(self, frame, timestamp):
+        if self.pending_model_complexity is not None:
+            self._apply_model_complexity()
+        
+        results = None
+        self.last_roi = None
+        
+        if self.roi_tracking and self.frames_since_full_search < self.roi_full_search_interval:
+            roi = self._compute_roi(frame.shape, timestamp)
+            if roi is not None:
+                results = self._detect_in_roi(frame, roi)
+                if results.multi_hand_landmarks:
+                    self.last_roi = roi
+                    self.roi_count += 1
+                    self.frames_since_full_search += 1
+                else:
+                    # Takip kaybedildi, aynı karede tüm görüntüde aranır
+                    results = None
+        
+        if results is None:
+            rgb_frame = self._prepare_input(frame)
+            results = self.hands.process(rgb_frame)
+            self.frames_since_full_search = 0
+        
+        self.predictor.update(results, timestamp)
+        self.frames_since_detection = 0
+        self.inference_count += 1
+        return results
     
-    def is_drawing_mode(self, hand_landmarks):  
-        return (self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.INDEX_FINGER_TIP, self.mp_hands.HandLandmark.INDEX_FINGER_PIP) and  
-                not self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP, self.mp_hands.HandLandmark.MIDDLE_FINGER_PIP) and  
-                not self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.RING_FINGER_TIP, self.mp_hands.HandLandmark.RING_FINGER_PIP) and  
-                not self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.PINKY_TIP, self.mp_hands.HandLandmark.PINKY_PIP))  
+    def _compute_roi(self, shape, timestamp):
+        bounds = self.predictor.bounds(timestamp)
+        if bounds is None:
+            return None
+        
+        height, width = shape[:2]
+        x1, y1, x2, y2 = bounds
+        center_x = (x1 + x2) / 2 * width
+        center_y = (y1 + y2) / 2 * height
+        
+        # Kare biçimli kırpma, elin en uzun kenarının her yöne roi_padding katı kadar genişletilmişidir
+        hand_size = max((x2 - x1) * width, (y2 - y1) * height)
+        size = int(max(hand_size * (1 + 2 * self.roi_padding), self.roi_min_size))
+        if size >= min(width, height):
+            return None
+        
+        left = int(min(max(center_x - size / 2, 0), width - size))
+        top = int(min(max(center_y - size / 2, 0), height - size))
+        return left, top, size
     
-    def is_text_mode(self, hand_landmarks, width, height):  
-        thumb_tip = self.get_landmark_position(hand_landmarks, width, height, self.mp_hands.HandLandmark.THUMB_TIP)  
-        index_tip = self.get_landmark_position(hand_landmarks, width, height, self.mp_hands.HandLandmark.INDEX_FINGER_TIP)  
+    def _detect_in_roi(self, frame, roi):
+        left, top, size = roi
+        crop = frame[top:top + size, left:left + size]
         
-        distance = np.sqrt((thumb_tip[0] - index_tip[0])**2 + (thumb_tip[1] - index_tip[1])**2)  
+        # Kırpma her zaman aynı boyuta ölçeklenir, böylece tamponlar tekrar kullanılır
+        input_shape = (self.roi_input_size, self.roi_input_size, frame.shape[2])
+        roi_frame = self.buffer_pool.get("roi", input_shape, frame.dtype)
+        cv2.resize(crop, (self.roi_input_size, self.roi_input_size), roi_frame, interpolation=cv2.INTER_AREA)
+        rgb_frame = cv2.cvtColor(roi_frame, cv2.COLOR_BGR2RGB, self.buffer_pool.get("roi_rgb", input_shape, frame.dtype))
+        results = self.roi_hands.process(rgb_frame)
         
-        other_fingers_up = (  
-            self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP, self.mp_hands.HandLandmark.MIDDLE_FINGER_PIP) and  
-            self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.RING_FINGER_TIP, self.mp_hands.HandLandmark.RING_FINGER_PIP) and  
-            self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.PINKY_TIP, self.mp_hands.HandLandmark.PINKY_PIP)  
-        )  
+        if results.multi_hand_landmarks:
+            height, width = frame.shape[:2]
+            for hand_landmarks in results.multi_hand_landmarks:
+                for landmark in hand_landmarks.landmark:
+                    landmark.x = (landmark.x * size + left) / width
+                    landmark.y = (landmark.y * size + top) / height
+                    landmark.z = landmark.z * size / width
+        return results
+    
+    def hint(self, results, timestamp):
+        # Sıradaki ROI ve tahmin, başka bir işçinin daha yeni tespitinden hesaplanır
+        if self.predictor.timestamp is None or timestamp > self.predictor.timestamp:
+            self.predictor.update(results, timestamp)
+    
+    def reset(self):
+        # Video modundaki MediaPipe takibi önceki kaynağın son karesini hatırlar, model yeniden kurulur
+        if self.pending_model_complexity is not None:
+            self.model_complexity = self.pending_model_complexity
+            self.pending_model_complexity = None
+        self._rebuild_hands()
         
-        return distance < 50 and other_fingers_up  
+        self.predictor.reset()
+        if self.motion_gate is not None:
+            self.motion_gate.reset()
+        self.last_results = None
+        self.last_roi = None
+        self.frames_since_detection = 0
+        self.frames_since_full_search = 0
     
-    def is_gesture_mode(self, hand_landmarks):  
-        return (self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.THUMB_TIP, self.mp_hands.HandLandmark.THUMB_IP) and  
-                self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.INDEX_FINGER_TIP, self.mp_hands.HandLandmark.INDEX_FINGER_PIP) and  
-                self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP, self.mp_hands.HandLandmark.MIDDLE_FINGER_PIP) and  
-                self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.RING_FINGER_TIP, self.mp_hands.HandLandmark.RING_FINGER_PIP) and  
-                self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.PINKY_TIP, self.mp_hands.HandLandmark.PINKY_PIP))  
+    def set_model_complexity(self, model_complexity):
+        # Model, tespit iş parçacığında bir sonraki _detect çağrısında yeniden kurulur
+        if model_complexity != self.model_complexity:
+            self.pending_model_complexity = model_complexity
     
-    def is_selection_mode(self, hand_landmarks):  
-        return (self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.INDEX_FINGER_TIP, self.mp_hands.HandLandmark.INDEX_FINGER_PIP) and  
-                self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP, self.mp_hands.HandLandmark.MIDDLE_FINGER_PIP) and  
-                self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.RING_FINGER_TIP, self.mp_hands.HandLandmark.RING_FINGER_PIP) and  
-                not self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.PINKY_TIP, self.mp_hands.HandLandmark.PINKY_PIP))  
+    def _apply_model_complexity(self):
+        self.model_complexity = self.pending_model_complexity
+        self.pending_model_complexity = None
+        self._rebuild_hands()
+        self.frames_since_full_search = 0
+    
+    def _rebuild_hands(self):
+        self.hands.close()
+        self.hands = self._create_hands()
+        if self.roi_hands is not None:
+            self.roi_hands.close()
+            self.roi_hands = self._create_hands()
+    
+    @property
+    def motion_skip_rate(self):
+        return self.motion_gate.skip_rate if self.motion_gate is not None else 0.0
+    
+    def set_detection_interval(self, interval):
+        self.detection_interval = max(1, int(interval))
+    
+    def set_detection_scale(self, scale):
+        self.detection_scale = min(1.0, max(0.1, scale))
+    
+    def _prepare_input(self, frame):
+        # Küçültme tüm kareye eşit uygulandığı için normalize landmark'lar tam çözünürlükte de geçerlidir
+        if self.detection_scale < 1.0:
+            height, width = frame.shape[:2]
+            size = (max(1, int(width * self.detection_scale)), max(1, int(height * self.detection_scale)))
+            small_frame = self.buffer_pool.get("small", (size[1], size[0], frame.shape[2]), frame.dtype)
+            frame = cv2.resize(frame, size, small_frame, interpolation=cv2.INTER_AREA)
+        
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, self.buffer_pool.get("rgb", frame.shape, frame.dtype))
     
-    def _is_finger_up(self, hand_landmarks, tip_idx, pip_idx):  
-        return hand_landmarks.landmark[tip_idx].y < hand_landmarks.landmark[pip_idx].y  
+    def close(self):
+        self.hands.close()
+        if self.roi_hands is not None:
+            self.roi_hands.close()
+        super().close()
 
 """  
 Burdaki sınıf, MediaPipe kütüphanesini kullanarak el hareketlerini tespit eder.  
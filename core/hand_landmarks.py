@@ -0,0 +1,108 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+class Landmark:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def HasField(self, name):
+        # mp_drawing.draw_landmarks görünürlük alanlarını bu metotla sorar
+        return False
+
+class LandmarkList:
+    __slots__ = ("landmark",)
+
+    def __init__(self, landmark=None):
+        self.landmark = landmark or []
+
+    @classmethod
+    def from_array(cls, array):
+        return cls([Landmark(float(x), float(y), float(z)) for x, y, z in array])
+
+class Classification:
+    __slots__ = ("index", "label", "score")
+
+    def __init__(self, label="Right", score=1.0, index=0):
+        self.index = index
+        self.label = label
+        self.score = score
+
+class Handedness:
+    __slots__ = ("classification",)
+
+    def __init__(self, label="Right", score=1.0):
+        self.classification = [Classification(label, score, 0 if label == "Left" else 1)]
+
+class DetectionResults:
+    __slots__ = ("multi_hand_landmarks", "multi_handedness")
+
+    def __init__(self, multi_hand_landmarks=None, multi_handedness=None):
+        self.multi_hand_landmarks = multi_hand_landmarks
+        self.multi_handedness = multi_handedness
+
+def landmarks_to_array(hand_landmarks, out=None):
+    if out is None:
+        out = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+    for idx, landmark in enumerate(hand_landmarks.landmark):
+        out[idx, 0] = landmark.x
+        out[idx, 1] = landmark.y
+        out[idx, 2] = landmark.z
+    return out
+
+def results_to_arrays(results):
+    if not results.multi_hand_landmarks:
+        return []
+    return [landmarks_to_array(hand_landmarks) for hand_landmarks in results.multi_hand_landmarks]
+
+def results_from_arrays(landmarks, scores, labels):
+    if not len(landmarks):
+        return DetectionResults()
+    hands = [LandmarkList.from_array(array) for array in landmarks]
+    handedness = [Handedness(str(label), float(score)) for label, score in zip(labels, scores)]
+    return DetectionResults(hands, handedness)
+
+def handedness_score(results, hand_idx):
+    if not results.multi_handedness or hand_idx >= len(results.multi_handedness):
+        return 1.0
+    return results.multi_handedness[hand_idx].classification[0].score
+
+def handedness_label(results, hand_idx):
+    if not results.multi_handedness or hand_idx >= len(results.multi_handedness):
+        return "Right"
+    return results.multi_handedness[hand_idx].classification[0].label
+
+def match_wrists(previous, current):
+    # MediaPipe ellerin sırasını kareden kareye değiştirebilir; her yeni el en yakın
+    # bilek konumundaki önceki ele eşlenir. Sonuç her yeni el için önceki indeks ya da -1
+    assignment = [-1] * len(current)
+    if len(previous) == 0 or len(current) == 0:
+        return assignment
+
+    previous = np.asarray(previous, dtype=np.float32)[:, :2]
+    current = np.asarray(current, dtype=np.float32)[:, :2]
+    distances = np.linalg.norm(current[:, None, :] - previous[None, :, :], axis=2)
+    used = set()
+    for flat_idx in np.argsort(distances, axis=None):
+        current_idx, previous_idx = divmod(int(flat_idx), len(previous))
+        if assignment[current_idx] == -1 and previous_idx not in used:
+            assignment[current_idx] = previous_idx
+            used.add(previous_idx)
+    return assignment
+
+# -----------------------------------------------------------------
+# MediaPipe sonuçlarıyla aynı yapıda (multi_hand_landmarks[i].landmark[j].x)
+# hafif landmark sınıfları ve NumPy dizisine dönüştürme yardımcıları.
+# Tahmin edilen ya da başka bir kaynaktan gelen landmark'lar bu sınıflarla
+# paketlenir, böylece modların kodu değişmeden çalışır.
+# -----------------------------------------------------------------
@@ -0,0 +1,80 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import numpy as np
+from core.hand_landmarks import landmarks_to_array, handedness_score
+
+THUMB = 1
+INDEX = 2
+MIDDLE = 4
+RING = 8
+PINKY = 16
+ALL_FINGERS = THUMB | INDEX | MIDDLE | RING | PINKY
+
+# Parmak ucu ve karşılaştırıldığı eklem (başparmakta IP, diğerlerinde PIP)
+FINGER_TIPS = np.array([4, 8, 12, 16, 20])
+FINGER_JOINTS = np.array([3, 6, 10, 14, 18])
+FINGER_BITS = np.array([THUMB, INDEX, MIDDLE, RING, PINKY])
+
+class HandState:
+    __slots__ = ("landmarks", "pixels", "finger_mask", "width", "height", "score", "source")
+
+    def __init__(self, landmarks, width, height, score=1.0, source=None):
+        self.landmarks = landmarks
+        self.width = width
+        self.height = height
+        self.score = score
+        # Landmark çizimi gibi MediaPipe yapısı isteyen yerler için orijinal nesne
+        self.source = source
+        self.refresh()
+
+    @classmethod
+    def from_landmarks(cls, hand_landmarks, width, height, score=1.0):
+        return cls(landmarks_to_array(hand_landmarks), width, height, score, hand_landmarks)
+
+    def refresh(self):
+        # Piksel koordinatları int() ile aynı şekilde sıfıra doğru kırpılır
+        scale = np.array([self.width, self.height], dtype=np.float64)
+        self.pixels = (self.landmarks[:, :2] * scale).astype(np.int32)
+
+        tips_y = self.landmarks[FINGER_TIPS, 1]
+        joints_y = self.landmarks[FINGER_JOINTS, 1]
+        self.finger_mask = int(FINGER_BITS[tips_y < joints_y].sum())
+
+    def position(self, landmark_idx):
+        x, y = self.pixels[landmark_idx]
+        return (int(x), int(y))
+
+    def is_up(self, fingers):
+        return self.finger_mask & fingers == fingers
+
+    def fingers_match(self, up, down=0):
+        return self.finger_mask & (up | down) == up
+
+    def distance(self, idx_a, idx_b):
+        dx, dy = self.pixels[idx_a] - self.pixels[idx_b]
+        return float(np.sqrt(dx * dx + dy * dy))
+
+def hands_from_results(results, width, height, max_hands=None):
+    if not results.multi_hand_landmarks:
+        return []
+
+    hands = []
+    for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
+        if max_hands is not None and hand_idx >= max_hands:
+            break
+        hands.append(HandState.from_landmarks(
+            hand_landmarks, width, height, handedness_score(results, hand_idx)
+        ))
+    return hands
+
+# -----------------------------------------------------------------
+# Kare başına bir kez oluşturulan el durumu. 21 landmark (21, 3) float32
+# dizisinde, piksel koordinatları (21, 2) int32 dizisinde tutulur. Hangi
+# parmakların kalkık olduğu 5 bitlik bir maskededir (THUMB=1 ... PINKY=16).
+# Modlar ve HandDetector'daki hareket kontrolleri protobuf alanlarını tekrar
+# tekrar okumak yerine bu nesneyi kullanır.
+# -----------------------------------------------------------------
@@ -0,0 +1,210 @@
+"""
+-------------
+Batuhan Korkmaz
+Full Stack Developer & EdTech Girişimcisi
+https://www.linkedin.com/in/batuhanfy/
+--------------
+"""
+
+import threading
+import zlib
+import numpy as np
+from config import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class HistoryEntry:
+    __slots__ = ("bounds", "shape", "patch", "data", "extra_nbytes", "pending", "stored")
+
+    def __init__(self, bounds, patch, extra_nbytes=0):
+        self.bounds = bounds
+        self.shape = patch.shape
+        self.patch = patch
+        self.data = None
+        # Kayda bağlı, başka yerde tutulan veri (ör. belge grubu) de bütçeye sayılır
+        self.extra_nbytes = extra_nbytes
+        self.pending = False
+        self.stored = True
+
+    @property
+    def patch_nbytes(self):
+        return self.patch.nbytes if self.patch is not None else len(self.data)
+
+    @property
+    def nbytes(self):
+        return self.patch_nbytes + self.extra_nbytes
+
+class HistoryStore:
+    def __init__(self, budget_mb=settings.HISTORY_BUDGET_MB, max_entries=settings.MAX_HISTORY,
+                 keep_raw=settings.HISTORY_KEEP_RAW, compression_level=1):
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.max_entries = max_entries
+        self.keep_raw = keep_raw
+        self.compression_level = compression_level
+
+        self.entries = []
+        self.index = 0
+        self.nbytes = 0
+        self.evicted = 0
+
+        self.pending = []
+        self.running = False
+        self.thread = None
+        self.condition = threading.Condition()
+
+    def start(self):
+        if self.running:
+            return self
+        self.running = True
+        self.thread = threading.Thread(target=self._compress_loop, name="HistoryStore", daemon=True)
+        self.thread.start()
+        return self
+
+    def push(self, bounds, patch, extra_nbytes=0):
+        with self.condition:
+            # Yeni düzenleme yineleme dalını geçersiz kılar
+            for entry in self.entries[self.index:]:
+                self._drop(entry)
+            del self.entries[self.index:]
+
+            entry = HistoryEntry(bounds, patch, extra_nbytes)
+            self.entries.append(entry)
+            self.index += 1
+            self.nbytes += entry.nbytes
+
+            while len(self.entries) > self.max_entries:
+                self._evict_oldest()
+            self._schedule()
+            # Sıkıştırma bekleyen varsa bütçe kararı iş parçacığına kalır; sınırın iki katı aşılmaz
+            if not self.pending or self.nbytes > 2 * self.budget:
+                self._evict_over_budget()
+
+    def undo(self, canvas):
+        with self.condition:
+            if self.index == 0:
+                return None
+            self.index -= 1
+            entry = self.entries[self.index]
+            self._swap(entry, canvas)
+            self._schedule()
+            return entry.bounds
+
+    def redo(self, canvas):
+        with self.condition:
+            if self.index >= len(self.entries):
+                return None
+            entry = self.entries[self.index]
+            self._swap(entry, canvas)
+            self.index += 1
+            self._schedule()
+            return entry.bounds
+
+    def clear(self):
+        with self.condition:
+            for entry in self.entries:
+                self._drop(entry)
+            self.entries = []
+            self.index = 0
+            self.nbytes = 0
+            self.pending = []
+
+    def close(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _swap(self, entry, canvas):
+        # Kayıttaki yama ile kanvastaki bölge yer değiştirir; aynı kayıt iki yönde de kullanılır
+        x1, y1, x2, y2 = entry.bounds
+        region = canvas[y1:y2, x1:x2]
+        current = region.copy()
+        if entry.patch is not None:
+            region[...] = entry.patch
+        else:
+            region[...] = np.frombuffer(zlib.decompress(entry.data), dtype=np.uint8).reshape(entry.shape)
+
+        self.nbytes += current.nbytes - entry.patch_nbytes
+        entry.patch = current
+        entry.data = None
+
+    def _schedule(self):
+        # İmlecin yakınındaki kayıtlar hızlı geri alma için ham kalır, gerisi sıkıştırılır
+        for position, entry in enumerate(self.entries):
+            if entry.patch is None or entry.pending:
+                continue
+            if abs(position - self.index) > self.keep_raw:
+                entry.pending = True
+                self.pending.append(entry)
+        if self.pending:
+            if not self.running:
+                self.start()
+            self.condition.notify_all()
+
+    def _compress_loop(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending or not self.running)
+                if not self.running:
+                    return
+                entry = self.pending.pop(0)
+                patch = entry.patch
+
+            if patch is None:
+                continue
+            # zlib büyük tamponlarda GIL'i bırakır, çizim döngüsü beklemez
+            data = zlib.compress(patch.tobytes(), self.compression_level)
+
+            with self.condition:
+                # Sıkıştırma sırasında yama geri alınıp değiştiyse sonuç atılır
+                self._store_compressed(entry, patch, data)
+                if not self.pending:
+                    self._evict_over_budget()
+
+    def _compress(self, entry):
+        if entry.patch is not None:
+            self._store_compressed(entry, entry.patch, zlib.compress(entry.patch.tobytes(), self.compression_level))
+
+    def _store_compressed(self, entry, patch, data):
+        entry.pending = False
+        if entry.patch is not patch or not entry.stored:
+            return
+        entry.data = data
+        entry.patch = None
+        self.nbytes += len(data) - patch.nbytes
+
+    def _evict_over_budget(self):
+        if self.nbytes > self.budget:
+            # Ham tutulan pencere bütçeye sığmıyorsa silmeden önce imlecin iki yanındaki
+            # kayıtlar dışında hepsi sıkıştırılır
+            for position, entry in enumerate(self.entries):
+                if position != self.index - 1 and position != self.index:
+                    self._compress(entry)
+        while self.nbytes > self.budget and self.index > 1:
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        entry = self.entries.pop(0)
+        self._drop(entry)
+        self.index = max(0, self.index - 1)
+        self.evicted += 1
+
+    def _drop(self, entry):
+        entry.stored = False
+        self.nbytes -= entry.nbytes
+
+"""
+Geri alma geçmişi için bellek bütçeli depo. Kayıtlar yalnızca değişen
+dikdörtgenin yamasını tutar. İmlecin HISTORY_KEEP_RAW adım uzağındaki yamalar
+arka planda zlib ile sıkıştırılır. Toplam boyut HISTORY_BUDGET_MB'ı aşınca en
+eski kayıtlar silinir. nbytes o anki bellek kullanımını verir, böylece
+çözünürlükten bağımsız olarak yüzlerce adım öngörülebilir bellekte tutulur.
+push'a verilen extra_nbytes kayda bağlı belge grubunun boyutudur; silinen
+kayıtların sayısı evicted ile izlenir, kanvas belgeyi buna göre kısaltır.
+"""
@@ -0,0 +1,272 @@
+"""
+-------------
+Batuhan Korkmaz
+Full Stack Developer & EdTech Girişimcisi
+https://www.linkedin.com/in/batuhanfy/
+--------------
+"""
+
+import cv2
+import os
+import shutil
+import tempfile
+import numpy as np
+from collections import OrderedDict
+from config import settings
+from core.canvas import Canvas
+from core.stroke_document import StrokeDocument
+from core.tile_grid import TileGrid
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class TileStore:
+    def __init__(self, tile_size=settings.CANVAS_TILE_SIZE, max_tiles=settings.INFINITE_CACHE_TILES,
+                 directory=settings.TILE_SPILL_DIRECTORY):
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+
+        # Dizin verilmezse oturuma özel geçici dizin açılır ve kapanışta silinir
+        self.owns_directory = directory is None
+        self.directory = tempfile.mkdtemp(prefix="airdraw_tiles_") if directory is None else directory
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.cache = OrderedDict()
+        self.modified = set()
+        self.spilled = set()
+        self.loads = 0
+        self.spills = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"tile_{key[0]}_{key[1]}.png")
+
+    def get(self, key):
+        tile = self.cache.get(key)
+        if tile is not None:
+            self.cache.move_to_end(key)
+            return tile
+        if key not in self.spilled:
+            return None
+
+        tile = cv2.imread(self._path(key), cv2.IMREAD_COLOR)
+        self.loads += 1
+        self._insert(key, tile)
+        return tile
+
+    def peek(self, key):
+        # Genel bakış için okuma: LRU sırası değişmez, diskten okunan karo önbelleğe girmez
+        tile = self.cache.get(key)
+        if tile is None and key in self.spilled:
+            tile = cv2.imread(self._path(key), cv2.IMREAD_COLOR)
+            self.loads += 1
+        return tile
+
+    def keys(self):
+        # Küme birleşimi kurulmaz; diskteki karo önbellekte de varsa bir kez verilir
+        yield from self.cache
+        for key in self.spilled:
+            if key not in self.cache:
+                yield key
+
+    def create(self, key):
+        tile = np.zeros((self.tile_size, self.tile_size, 3), dtype=np.uint8)
+        self._insert(key, tile)
+        return tile
+
+    def mark_modified(self, key):
+        self.modified.add(key)
+
+    def discard(self, key):
+        self.cache.pop(key, None)
+        self.modified.discard(key)
+        if key in self.spilled:
+            self.spilled.discard(key)
+            os.remove(self._path(key))
+
+    def _insert(self, key, tile):
+        self.cache[key] = tile
+        while len(self.cache) > self.max_tiles:
+            self._spill(*self.cache.popitem(last=False))
+
+    def _spill(self, key, tile):
+        # Değişmeyen karo diskte zaten vardır, tekrar yazılmaz
+        if key not in self.modified:
+            return
+        self.modified.discard(key)
+        if tile.any():
+            cv2.imwrite(self._path(key), tile)
+            self.spilled.add(key)
+            self.spills += 1
+        elif key in self.spilled:
+            self.spilled.discard(key)
+            os.remove(self._path(key))
+
+    @property
+    def nbytes(self):
+        return len(self.cache) * self.tile_size * self.tile_size * 3
+
+    def close(self):
+        self.cache.clear()
+        if self.owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+class InfiniteCanvas(Canvas):
+    def __init__(self, width=800, height=600, zoom_levels=settings.ZOOM_LEVELS):
+        super().__init__(width=width, height=height)
+        self.store = TileStore(self.tile_size)
+        # Dünyanın kaynağı karo deposudur; vektör belgesi tutulsaydı kaydırma ve
+        # geçmiş silme sonrasında da büyüyüp bellek sınırını bozardı
+        self.document = StrokeDocument(recording=False)
+        self.zoom_levels = zoom_levels
+        self.zoom = 1.0
+
+    @property
+    def editable(self):
+        return self.zoom == 1.0
+
+    def pan(self, dx, dy):
+        # Kaydırma görünüm pikseliyle verilir, uzaklaştırılmış görünümde dünyada daha uzağa gidilir
+        self._leave_view()
+        self.origin = (self.origin[0] + int(round(dx / self.zoom)), self.origin[1] + int(round(dy / self.zoom)))
+        self._enter_view()
+
+    def zoom_step(self, direction):
+        levels = list(self.zoom_levels)
+        idx = levels.index(self.zoom) if self.zoom in levels else levels.index(1.0)
+        new_idx = min(max(idx + direction, 0), len(levels) - 1)
+        if new_idx == idx:
+            return False
+
+        # Yakınlaştırma görünümün ortasına göre yapılır
+        self._leave_view()
+        center_x = self.origin[0] + self.width / (2 * self.zoom)
+        center_y = self.origin[1] + self.height / (2 * self.zoom)
+        self.zoom = levels[new_idx]
+        self.origin = (int(round(center_x - self.width / (2 * self.zoom))),
+                       int(round(center_y - self.height / (2 * self.zoom))))
+        self._enter_view()
+        return True
+
+    def resize(self, width, height):
+        self._leave_view()
+        self.width = width
+        self.height = height
+        self.canvas = np.zeros((height, width, 3), dtype=np.uint8)
+        self.tiles = TileGrid(width, height, self.tile_size)
+        self._enter_view()
+
+    def clear(self):
+        # Sadece görünüm temizlenir; geri alma geçmişi de görünüm kadardır, dünyanın
+        # geri kalanındaki karolar geri alınamaz şekilde silinmesin diye korunur
+        if self.editable:
+            super().clear()
+
+    def undo(self):
+        return self.editable and super().undo()
+
+    def redo(self):
+        return self.editable and super().redo()
+
+    def _render_scaled(self, scale):
+        # Belge tutulmadığı için yüksek çözünürlüklü kayıt görünümün büyütülmesidir
+        size = (int(self.width * scale), int(self.height * scale))
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_CUBIC
+        return cv2.resize(self.canvas, size, interpolation=interpolation)
+
+    def _leave_view(self):
+        self.commit_stroke()
+        if self.editable:
+            self._store_view()
+
+    def _enter_view(self):
+        self.canvas.fill(0)
+        if self.editable:
+            self._load_view()
+        else:
+            self._render_overview()
+        self.tiles.mark_all()
+
+        # Geri alma yamaları görünüme göre olduğu için kaydırmada geçmiş sıfırlanır
+        self.history.clear()
+        logger.debug(f"Görünüm: {self.origin}, yakınlaştırma {self.zoom}, önbellek {len(self.store.cache)} karo")
+
+    def _world_tiles(self, width, height):
+        size = self.tile_size
+        left, top = self.origin
+        for tile_y in range(top // size, (top + height - 1) // size + 1):
+            for tile_x in range(left // size, (left + width - 1) // size + 1):
+                # Karonun görünümle kesişimi dünya koordinatında
+                x1, y1 = max(tile_x * size, left), max(tile_y * size, top)
+                x2, y2 = min((tile_x + 1) * size, left + width), min((tile_y + 1) * size, top + height)
+                yield (tile_x, tile_y), x1, y1, x2, y2
+
+    def _store_view(self):
+        size = self.tile_size
+        left, top = self.origin
+        for key, x1, y1, x2, y2 in self._world_tiles(self.width, self.height):
+            view = self.canvas[y1 - top:y2 - top, x1 - left:x2 - left]
+            tile = self.store.get(key)
+            if tile is None:
+                if not view.any():
+                    continue
+                tile = self.store.create(key)
+            tile[y1 - key[1] * size:y2 - key[1] * size, x1 - key[0] * size:x2 - key[0] * size] = view
+            if tile.any():
+                self.store.mark_modified(key)
+            else:
+                self.store.discard(key)
+
+    def _load_view(self):
+        size = self.tile_size
+        left, top = self.origin
+        for key, x1, y1, x2, y2 in self._world_tiles(self.width, self.height):
+            tile = self.store.get(key)
+            if tile is not None:
+                self.canvas[y1 - top:y2 - top, x1 - left:x2 - left] = \
+                    tile[y1 - key[1] * size:y2 - key[1] * size, x1 - key[0] * size:x2 - key[0] * size]
+
+    def _render_overview(self):
+        # Her karo görünüm ölçeğine getirilip yerine konur; karo kenarları yuvarlanarak hizalanır.
+        # Görünümdeki tüm karo koordinatları yerine sadece depodaki karolar gezilir
+        size = self.tile_size
+        left, top = self.origin
+        zoom = self.zoom
+        tile_x1, tile_y1 = left // size, top // size
+        tile_x2 = (left + int(np.ceil(self.width / zoom)) - 1) // size
+        tile_y2 = (top + int(np.ceil(self.height / zoom)) - 1) // size
+        for key in self.store.keys():
+            if not (tile_x1 <= key[0] <= tile_x2 and tile_y1 <= key[1] <= tile_y2):
+                continue
+            tile = self.store.peek(key)
+            if tile is None:
+                continue
+            dx1 = int(round((key[0] * size - left) * zoom))
+            dy1 = int(round((key[1] * size - top) * zoom))
+            dx2 = int(round(((key[0] + 1) * size - left) * zoom))
+            dy2 = int(round(((key[1] + 1) * size - top) * zoom))
+            if dx2 <= dx1 or dy2 <= dy1:
+                continue
+            interpolation = cv2.INTER_AREA if zoom < 1 else cv2.INTER_NEAREST
+            scaled = cv2.resize(tile, (dx2 - dx1, dy2 - dy1), interpolation=interpolation)
+
+            cx1, cy1 = max(0, dx1), max(0, dy1)
+            cx2, cy2 = min(self.width, dx2), min(self.height, dy2)
+            if cx1 < cx2 and cy1 < cy2:
+                self.canvas[cy1:cy2, cx1:cx2] = scaled[cy1 - dy1:cy2 - dy1, cx1 - dx1:cx2 - dx1]
+
+    def close(self):
+        super().close()
+        self.store.close()
+
+"""
+Sınırsız kanvas. Kamera boyutundaki kanvas dizisi dünyaya açılan bir
+görünümdür; dünya 64x64 karolara bölünür ve karolar (x, y) karo
+koordinatıyla tutulur. Sık kullanılan karolar bellekte LRU önbellekte durur,
+önbellekten düşenler PNG olarak diske yazılır. Böylece ne kadar alan
+çizilirse çizilsin piksel belleği INFINITE_CACHE_TILES karo ile sınırlı kalır;
+çizilen alanla büyüyen tek şey diskteki karoların anahtar kümesidir (spilled,
+64x64 karo başına bir koordinat çifti). Görünüm i/j/k/l ile kaydırılır, u/o ile
+uzaklaştırılıp yakınlaştırılır. Çizim sadece 1x yakınlaştırmada yapılır; diğer
+seviyeler genel bakış içindir. Temizleme (clear) yalnızca görünümdeki alanı
+siler ve geri alınabilir; görünüm dışındaki karolara dokunmaz.
+"""
@@ -0,0 +1,128 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import math
+import numpy as np
+from config import settings
+from core.hand_landmarks import NUM_LANDMARKS, match_wrists
+
+class OneEuroFilter:
+    def __init__(self, min_cutoff=settings.SMOOTHING_MIN_CUTOFF, beta=settings.SMOOTHING_BETA,
+                 d_cutoff=settings.SMOOTHING_D_CUTOFF, max_gap=0.5, shape=(NUM_LANDMARKS, 3)):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.max_gap = max_gap
+
+        # Ara sonuçlar için diziler bir kez ayrılır, her karede yeniden kullanılır
+        self.value = np.zeros(shape, dtype=np.float32)
+        self.derivative = np.zeros(shape, dtype=np.float32)
+        self.delta = np.empty(shape, dtype=np.float32)
+        self.alpha = np.empty(shape, dtype=np.float32)
+        self.denominator = np.empty(shape, dtype=np.float32)
+        self.timestamp = None
+
+    def reset(self):
+        self.timestamp = None
+
+    def filter(self, x, timestamp, out=None):
+        if out is None:
+            out = np.empty_like(x)
+
+        dt = None
+        if timestamp is not None and self.timestamp is not None:
+            dt = timestamp - self.timestamp
+        if dt is None or dt > self.max_gap:
+            # İlk örnek ya da uzun bir boşluk: filtre ham değerden yeniden başlar
+            self.value[...] = x
+            self.derivative.fill(0.0)
+            self.timestamp = timestamp
+            out[...] = x
+            return out
+        if dt <= 0:
+            # Aynı zaman damgalı kare (tekrar kullanılan tespit) filtreyi ilerletmez
+            out[...] = self.value
+            return out
+
+        # Türev kendi sabit kesim frekansıyla yumuşatılır
+        np.subtract(x, self.value, out=self.delta)
+        self.delta *= 1.0 / dt
+        self.delta -= self.derivative
+        self.delta *= self._alpha(self.d_cutoff, dt)
+        self.derivative += self.delta
+
+        # Hız arttıkça kesim frekansı yükselir: yavaşta titreme gider, hızlıda gecikme azalır
+        np.abs(self.derivative, out=self.alpha)
+        self.alpha *= self.beta
+        self.alpha += self.min_cutoff
+        self.alpha *= 2.0 * math.pi * dt
+        np.add(self.alpha, 1.0, out=self.denominator)
+        self.alpha /= self.denominator
+
+        np.subtract(x, self.value, out=self.delta)
+        self.delta *= self.alpha
+        self.value += self.delta
+
+        self.timestamp = timestamp
+        out[...] = self.value
+        return out
+
+    def _alpha(self, cutoff, dt):
+        r = 2.0 * math.pi * cutoff * dt
+        return r / (r + 1.0)
+
+class LandmarkFilter:
+    def __init__(self, min_cutoff=settings.SMOOTHING_MIN_CUTOFF, beta=settings.SMOOTHING_BETA,
+                 d_cutoff=settings.SMOOTHING_D_CUTOFF, max_gap=0.5):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.max_gap = max_gap
+        self.filters = []
+        # Her filtrenin son gördüğü elin bilek konumu; boş filtrede None
+        self.wrists = []
+
+    def apply(self, hands, timestamp):
+        while len(self.filters) < len(hands):
+            self.filters.append(OneEuroFilter(self.min_cutoff, self.beta, self.d_cutoff, self.max_gap))
+            self.wrists.append(None)
+
+        # Filtre durumu liste sırasına değil bilek konumuna göre ele bağlanır, eller yer değiştirse de karışmaz
+        active = [idx for idx, wrist in enumerate(self.wrists) if wrist is not None]
+        assignment = match_wrists([self.wrists[idx] for idx in active], [hand.landmarks[0] for hand in hands])
+        slots = [active[matched] if matched != -1 else -1 for matched in assignment]
+        free = [idx for idx in range(len(self.filters)) if idx not in slots]
+        for hand_idx, slot in enumerate(slots):
+            if slot == -1:
+                slot = free.pop(0)
+                self.filters[slot].reset()
+                slots[hand_idx] = slot
+
+        for hand, slot in zip(hands, slots):
+            self.filters[slot].filter(hand.landmarks, timestamp, out=hand.landmarks)
+            hand.refresh()
+
+        # Kaybolan ellerin durumu silinir, geri geldiklerinde eski konumdan süzülmezler
+        for slot in range(len(self.filters)):
+            if slot in slots:
+                self.wrists[slot] = hands[slots.index(slot)].landmarks[0, :2].copy()
+            else:
+                self.filters[slot].reset()
+                self.wrists[slot] = None
+        return hands
+
+    def reset(self):
+        for one_euro in self.filters:
+            one_euro.reset()
+        self.wrists = [None] * len(self.filters)
+
+# -----------------------------------------------------------------
+# One-Euro filtresi ile landmark yumuşatma. Bir eldeki 21 noktanın tamamı tek
+# seferde NumPy ile süzülür, her el için ayrı filtre durumu tutulur. Yavaş
+# hareketlerde kesim frekansı düşüktür ve titreme kaybolur; hızlı
+# hareketlerde frekans yükselir ve çizgi parmağın gerisinde kalmaz.
+# min_cutoff titremeyi, beta gecikmeyi ayarlar (settings.SMOOTHING_*).
+# -----------------------------------------------------------------
@@ -0,0 +1,96 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import numpy as np
+from core.hand_landmarks import LandmarkList, DetectionResults, results_to_arrays, handedness_score, match_wrists
+
+class LandmarkPredictor:
+    def __init__(self, min_confidence=0.5, max_displacement=0.1, max_gap=0.5):
+        self.min_confidence = min_confidence
+        self.max_displacement = max_displacement
+        self.max_gap = max_gap
+
+        self.positions = []
+        self.velocities = []
+        self.scores = []
+        self.handedness = None
+        self.timestamp = None
+
+    def reset(self):
+        self.positions = []
+        self.velocities = []
+        self.scores = []
+        self.handedness = None
+        self.timestamp = None
+
+    def update(self, results, timestamp):
+        positions = results_to_arrays(results)
+
+        # Hız yalnızca aynı sayıda el art arda görüldüyse hesaplanır; eller sıra değiştirmiş
+        # olabileceği için her el bilek konumuna göre önceki karedeki eşiyle karşılaştırılır
+        dt = timestamp - self.timestamp if self.timestamp is not None else 0.0
+        if positions and len(positions) == len(self.positions) and 0 < dt <= self.max_gap:
+            assignment = match_wrists([old[0] for old in self.positions], [new[0] for new in positions])
+            self.velocities = [
+                (new - self.positions[matched]) / dt if matched != -1 else np.zeros_like(new)
+                for new, matched in zip(positions, assignment)
+            ]
+        else:
+            self.velocities = [np.zeros_like(p) for p in positions]
+
+        self.positions = positions
+        self.scores = [handedness_score(results, idx) for idx in range(len(positions))]
+        self.handedness = results.multi_handedness
+        self.timestamp = timestamp
+
+    def confidence(self, timestamp):
+        if not self.positions or self.timestamp is None:
+            return 0.0
+
+        dt = timestamp - self.timestamp
+        if dt < 0 or dt > self.max_gap:
+            return 0.0
+
+        confidence = 1.0
+        for position, velocity, score in zip(self.positions, self.velocities, self.scores):
+            # Hızlı hareket ettikçe ya da el kenara yaklaştıkça tahmine daha az güvenilir
+            displacement = float(np.abs(velocity[:, :2]).max()) * dt
+            predicted = position[:, :2] + velocity[:, :2] * dt
+            if predicted.min() < 0.0 or predicted.max() > 1.0:
+                return 0.0
+            confidence = min(confidence, score * (1.0 - displacement / self.max_displacement))
+        return max(0.0, confidence)
+
+    def bounds(self, timestamp):
+        if not self.positions or self.timestamp is None:
+            return None
+
+        dt = min(max(timestamp - self.timestamp, 0.0), self.max_gap)
+        points = np.concatenate([
+            position[:, :2] + velocity[:, :2] * dt
+            for position, velocity in zip(self.positions, self.velocities)
+        ])
+        x1, y1 = points.min(axis=0)
+        x2, y2 = points.max(axis=0)
+        return float(x1), float(y1), float(x2), float(y2)
+
+    def predict(self, timestamp):
+        if self.confidence(timestamp) < self.min_confidence:
+            return None
+
+        dt = timestamp - self.timestamp
+        hands = [
+            LandmarkList.from_array(position + velocity * dt)
+            for position, velocity in zip(self.positions, self.velocities)
+        ]
+        return DetectionResults(hands, self.handedness)
+
+# -----------------------------------------------------------------
+# Sabit hız modeliyle el landmark tahmini. Son iki gerçek tespitten 21 noktanın
+# hızı hesaplanır ve aradaki karelerde konum ileriye doğru tahmin edilir.
+# Hareket çok hızlıysa, el kare dışına taşıyorsa ya da son tespit eskiyse
+# güven düşer ve HandDetector yeniden gerçek tespit yapar.
+# -----------------------------------------------------------------
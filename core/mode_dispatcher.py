@@ -0,0 +1,66 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+from core.hand_state import ALL_FINGERS
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+NUM_POSES = ALL_FINGERS + 1
+
+class ModeDispatcher:
+    def __init__(self):
+        # Her parmak maskesi için koşulsuz tek bir sahip ve ek koşullu adaylar
+        self.owners = [None] * NUM_POSES
+        self.conditional = [[] for _ in range(NUM_POSES)]
+        self.ambiguous_poses = {}
+
+    def register(self, mode):
+        if mode.poses is None:
+            # Poz bildirmeyen modlar her maskede eski check_activation ile sorulur
+            masks = range(NUM_POSES)
+            predicate = mode.check_activation
+        else:
+            masks = mode.poses
+            predicate = mode.pose_predicate
+
+        for mask in masks:
+            if predicate is not None:
+                self.conditional[mask].append((mode, predicate))
+            elif self.owners[mask] is None:
+                self.owners[mask] = mode
+            else:
+                self._report(mask, [self.owners[mask], mode])
+
+    def dispatch(self, hand, width, height):
+        mask = hand.finger_mask
+        candidates = self.conditional[mask]
+        if candidates:
+            matched = [mode for mode, predicate in candidates if predicate(hand, width, height)]
+            if matched:
+                if len(matched) > 1:
+                    self._report(mask, matched)
+                return matched[0]
+        return self.owners[mask]
+
+    def owner(self, mask):
+        return self.owners[mask]
+
+    def _report(self, mask, modes):
+        names = [mode.name for mode in modes]
+        if self.ambiguous_poses.get(mask) == names:
+            return
+        self.ambiguous_poses[mask] = names
+        logger.warning(f"Belirsiz poz {mask:05b}: {', '.join(names)} (ilk kaydedilen seçilir)")
+
+# -----------------------------------------------------------------
+# Parmak maskesine göre mod seçimi. 32 elemanlı tablo her poz için hangi modun
+# çalışacağını tutar, böylece modlar sırayla denenmez ve mod sayısı arttıkça
+# maliyet değişmez. Yazı modundaki kıskaç mesafesi gibi ek koşullar aynı
+# pozun koşulsuz sahibinden önce denenir. Aynı pozu iki mod sahiplenirse
+# ya da iki koşul birden tutarsa uyarı verilir ve ambiguous_poses'a yazılır.
+# Maskedeki bit sırası sağdan sola başparmak, işaret, orta, yüzük, serçe.
+# -----------------------------------------------------------------
@@ -0,0 +1,84 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import cv2
+import numpy as np
+from config import settings
+
+class MotionGate:
+    def __init__(self, threshold=settings.MOTION_THRESHOLD, downsample=settings.MOTION_DOWNSAMPLE,
+                 roi_size=32, max_skip=settings.MOTION_MAX_SKIP):
+        self.threshold = threshold
+        self.downsample = downsample
+        self.roi_size = roi_size
+        self.max_skip = max_skip
+
+        self.reference = None
+        self.reference_roi = None
+        self.current = None
+        self.diff = None
+
+        self.checks = 0
+        self.skips = 0
+        self.consecutive_skips = 0
+        self.last_score = 0.0
+
+    def _thumbnail(self, frame, roi, out=None):
+        if roi is not None:
+            left, top, size = roi
+            frame = frame[top:top + size, left:left + size]
+            thumb_size = (self.roi_size, self.roi_size)
+        else:
+            height, width = frame.shape[:2]
+            thumb_size = (max(1, width // self.downsample), max(1, height // self.downsample))
+
+        # En yakın komşu örnekleme yeterli, amaç yalnızca kaba bir hareket ölçüsü
+        small = cv2.resize(frame, thumb_size, interpolation=cv2.INTER_NEAREST)
+        if out is None or out.shape != small.shape[:2]:
+            out = np.empty(small.shape[:2], dtype=np.uint8)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, out)
+
+    def is_static(self, frame):
+        if self.reference is None:
+            return False
+        if self.consecutive_skips >= self.max_skip:
+            self.consecutive_skips = 0
+            return False
+
+        self.checks += 1
+        self.current = self._thumbnail(frame, self.reference_roi, self.current)
+        if self.diff is None or self.diff.shape != self.current.shape:
+            self.diff = np.empty_like(self.current)
+        cv2.absdiff(self.current, self.reference, self.diff)
+        self.last_score = cv2.mean(self.diff)[0]
+
+        if self.last_score < self.threshold:
+            self.skips += 1
+            self.consecutive_skips += 1
+            return True
+        self.consecutive_skips = 0
+        return False
+
+    def update_reference(self, frame, roi=None):
+        self.reference_roi = roi
+        self.reference = self._thumbnail(frame, roi, self.reference)
+        self.consecutive_skips = 0
+
+    def reset(self):
+        self.reference = None
+        self.reference_roi = None
+        self.consecutive_skips = 0
+
+    @property
+    def skip_rate(self):
+        return self.skips / self.checks if self.checks else 0.0
+
+# -----------------------------------------------------------------
+# Hareket kapısı: son tespit yapılan kare ile şimdiki karenin küçültülmüş gri
+# kopyalarının mutlak farkına bakar. El biliniyorsa sadece el bölgesi
+# karşılaştırılır. Fark eşiğin altındaysa sahne durağandır ve önceki tespit
+# sonucu tekrar kullanılır. skip_rate ile atlanan tespit oranı ölçülebilir.
+# -----------------------------------------------------------------
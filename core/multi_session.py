@@ -0,0 +1,216 @@
+"""
+-------------
+Batuhan Korkmaz
+Full Stack Developer & EdTech Girişimcisi
+https://www.linkedin.com/in/batuhanfy/
+--------------
+"""
+
+import cv2
+import multiprocessing
+import queue
+import numpy as np
+from config import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def _put_latest(target_queue, item):
+    # Ana süreç yetişemezse eski kare atılır, kuyrukta gecikme birikmez
+    try:
+        target_queue.put_nowait(item)
+    except queue.Full:
+        try:
+            target_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            target_queue.put_nowait(item)
+        except queue.Full:
+            pass
+
+def _session_worker(index, source, realtime, output_width, frame_queue, key_queue, stop_event,
+                    backend=None, landmarks_file=None):
+    # Her oturum kendi sürecinde kendi kaynağı, el tespiti, kanvası ve modlarıyla çalışır
+    from core.detector_backend import create_hand_detector
+    from core.engine import AirDrawEngine
+    from core.frame_source import create_frame_source
+    from utils.fps_counter import FPSCounter
+
+    frame_source = None
+    engine = None
+    # Kaynak ya da motor açılamasa da ana süreç bitiş işaretini almalı
+    try:
+        frame_source = create_frame_source(source, realtime=realtime).start()
+        hand_detector = create_hand_detector(backend, landmarks_file)
+        engine = AirDrawEngine(frame_source.width, frame_source.height, hand_detector=hand_detector)
+        fps_counter = FPSCounter()
+
+        output_size = None
+        if output_width and output_width < frame_source.width:
+            output_size = (output_width, int(frame_source.height * output_width / frame_source.width))
+
+        while not stop_event.is_set():
+            keys = []
+            while True:
+                try:
+                    keys.append(key_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            success, frame = frame_source.read()
+            if not success:
+                break
+
+            result = engine.step(frame, frame_source.last_timestamp, keys)
+            fps = fps_counter.update()
+
+            cv2.putText(
+                result.frame,
+                f"{index + 1}: {result.mode.name}  FPS: {int(fps)}",
+                (10, 30),
+                cv2.FONT_HERSHEY_PLAIN,
+                2,
+                (255, 0, 255),
+                2
+            )
+
+            # Kuyruk kareyi arka planda serileştirir; motorun tamponu o sırada yeniden kullanılabilir
+            if output_size is not None:
+                output = cv2.resize(result.frame, output_size, interpolation=cv2.INTER_AREA)
+            else:
+                output = result.frame.copy()
+            _put_latest(frame_queue, output)
+    except Exception as e:
+        logger.exception(f"Oturum {index + 1} hata verdi ({source}): {e}")
+    finally:
+        if frame_source is not None:
+            frame_source.release()
+        if engine is not None:
+            engine.hand_detector.close()
+            engine.close()
+        _put_latest(frame_queue, None)
+
+class MultiCameraApp:
+    def __init__(self, sources, sink=settings.MULTI_SESSION_SINK, realtime=settings.REPLAY_REALTIME,
+                 backend=None, landmarks_file=None):
+        self.sources = list(sources)
+        self.sink = sink
+        self.realtime = realtime
+        self.backend = backend
+        self.landmarks_file = landmarks_file
+        self.focus = 0
+        self.running = False
+
+        self.context = multiprocessing.get_context("spawn")
+        self.stop_event = self.context.Event()
+        self.frame_queues = [self.context.Queue(maxsize=2) for _ in self.sources]
+        self.key_queues = [self.context.Queue() for _ in self.sources]
+        self.processes = []
+
+        self.latest_frames = [None] * len(self.sources)
+        self.finished = [False] * len(self.sources)
+
+    def start(self):
+        # Tek pencerede döşenecekse kareler işçi süreçte küçültülür, aktarım maliyeti düşer
+        output_width = settings.MULTI_TILE_WIDTH if self.sink == "tile" else None
+        for index, source in enumerate(self.sources):
+            process = self.context.Process(
+                target=_session_worker,
+                args=(index, source, self.realtime, output_width,
+                      self.frame_queues[index], self.key_queues[index], self.stop_event,
+                      self.backend, self.landmarks_file),
+                name=f"airdraw-session-{index + 1}",
+                daemon=True
+            )
+            process.start()
+            self.processes.append(process)
+        logger.info(f"{len(self.sources)} oturum başlatıldı ({self.sink})")
+
+    def run(self):
+        self.start()
+        self.running = True
+        try:
+            while self.running and not all(self.finished):
+                self._collect_frames()
+                self._show()
+                self._handle_key_press(cv2.waitKey(1))
+        finally:
+            self.stop()
+
+    def _collect_frames(self):
+        for index, frame_queue in enumerate(self.frame_queues):
+            while True:
+                try:
+                    frame = frame_queue.get(timeout=0.001)
+                except queue.Empty:
+                    break
+                if frame is None:
+                    self.finished[index] = True
+                    break
+                self.latest_frames[index] = frame
+
+            # Bitiş işaretini gönderemeden ölen süreç de bitmiş sayılır, döngü takılmaz
+            if not self.finished[index] and not self.processes[index].is_alive():
+                logger.warning(f"Oturum {index + 1} beklenmedik şekilde kapandı")
+                self.finished[index] = True
+
+    def _show(self):
+        frames = [frame for frame in self.latest_frames if frame is not None]
+        if not frames:
+            return
+
+        if self.sink == "windows":
+            for index, frame in enumerate(self.latest_frames):
+                if frame is not None:
+                    cv2.imshow(f"AirDraw {index + 1}", frame)
+            return
+
+        cv2.imshow("AirDraw", self._tile(frames))
+
+    def _tile(self, frames):
+        columns = int(np.ceil(np.sqrt(len(frames))))
+        rows = int(np.ceil(len(frames) / columns))
+        tile_height = max(frame.shape[0] for frame in frames)
+        tile_width = max(frame.shape[1] for frame in frames)
+
+        mosaic = np.zeros((rows * tile_height, columns * tile_width, 3), dtype=np.uint8)
+        for index, frame in enumerate(frames):
+            row, column = divmod(index, columns)
+            height, width = frame.shape[:2]
+            top = row * tile_height
+            left = column * tile_width
+            mosaic[top:top + height, left:left + width] = frame
+            if index == self.focus:
+                cv2.rectangle(mosaic, (left, top), (left + width - 1, top + height - 1), (0, 255, 0), 3)
+        return mosaic
+
+    def _handle_key_press(self, key):
+        if key == -1:
+            return
+        if key == 27:
+            logger.info("Uygulama sonlandırılıyor...")
+            self.running = False
+        elif key == 9:
+            # Tab ile tuşların gönderileceği oturum değiştirilir
+            self.focus = (self.focus + 1) % len(self.sources)
+            logger.info(f"Aktif oturum: {self.focus + 1}")
+        else:
+            self.key_queues[self.focus].put(key)
+
+    def stop(self):
+        self.stop_event.set()
+        for process in self.processes:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+        cv2.destroyAllWindows()
+        logger.info("Tüm oturumlar kapatıldı")
+
+"""
+Birden fazla kamera (örneğin öğretmen ve doküman kamerası) için çoklu oturum.
+Her kaynak ayrı bir süreçte kendi el tespiti, kanvası ve modlarıyla çalışır,
+böylece iş tek bir GIL'i paylaşmak yerine çekirdeklere dağılır. Çıktılar tek
+pencerede döşenir ("tile") ya da her oturum kendi penceresinde gösterilir
+("windows"). Tab tuşu klavye girdisinin gideceği oturumu değiştirir.
+"""
@@ -0,0 +1,258 @@
+"""
+-------------
+Batuhan Korkmaz
+Full Stack Developer & EdTech Girişimcisi
+https://www.linkedin.com/in/batuhanfy/
+--------------
+"""
+
+import cv2
+import queue
+import threading
+import time
+from collections import deque
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class FramePacket:
+    __slots__ = ("seq", "timestamp", "frame", "results", "status_text", "status_color", "mode")
+
+    def __init__(self, seq, timestamp, frame):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.frame = frame
+        self.results = None
+        self.status_text = None
+        self.status_color = None
+        self.mode = None
+
+class FramePipeline:
+    def __init__(self, app, queue_size=2, poll_interval=0.05):
+        self.app = app
+        self.engine = app.engine
+
+        # Kuyruklardaki ve aşamalardaki tüm kareler aynı anda yaşayabilir; tespit aşaması
+        # sonucu beklenen max_in_flight kadar kareyi birlikte tutar
+        max_in_flight = self.engine.hand_detector.max_in_flight
+        self.engine.buffer_pool.set_depth(3 * queue_size + 3 + max_in_flight)
+        self.poll_interval = poll_interval
+
+        self.detect_queue = queue.Queue(maxsize=queue_size)
+        self.update_queue = queue.Queue(maxsize=queue_size)
+        self.display_queue = queue.Queue(maxsize=queue_size)
+        self.key_queue = queue.Queue()
+
+        self.threads = []
+        self.last_seq = -1
+        self.frames_dropped = 0
+        self.frames_out_of_order = 0
+        self.stage_times = {"detect": 0.0, "update": 0.0}
+
+    def _record_stage_time(self, name, start_time, smoothing=0.1):
+        elapsed = time.perf_counter() - start_time
+        previous = self.stage_times[name]
+        self.stage_times[name] = elapsed if previous == 0 else previous + smoothing * (elapsed - previous)
+
+    def bottleneck_time(self):
+        return max(self.stage_times.values())
+
+    def queue_depths(self):
+        return {
+            "tespit": self.detect_queue.qsize(),
+            "mod": self.update_queue.qsize(),
+            "ekran": self.display_queue.qsize()
+        }
+
+    def run(self):
+        stages = [
+            ("capture", self._capture_stage, self.detect_queue),
+            ("detect", self._detect_stage, self.update_queue),
+            ("update", self._update_stage, self.display_queue)
+        ]
+        for name, target, downstream in stages:
+            thread = threading.Thread(
+                target=self._run_stage,
+                args=(name, target, downstream),
+                name=f"pipeline-{name}",
+                daemon=True
+            )
+            thread.start()
+            self.threads.append(thread)
+
+        logger.info("Boru hattı modu başlatıldı")
+        try:
+            self._display_stage()
+        finally:
+            self.app.running = False
+            for thread in self.threads:
+                thread.join(timeout=1.0)
+            logger.info(
+                f"Boru hattı durdu (atlanan: {self.frames_dropped}, sıra dışı: {self.frames_out_of_order})"
+            )
+
+    def _run_stage(self, name, target, downstream):
+        # Bir aşama hata verirse uygulama durdurulur ve sonraki aşamalar bitiş işaretiyle uyanır
+        try:
+            target()
+        except Exception as e:
+            logger.exception(f"Boru hattı aşaması hata verdi ({name}): {e}")
+            self.app.running = False
+            self._put_sentinel(downstream)
+
+    def _put_sentinel(self, target_queue):
+        while True:
+            try:
+                target_queue.put_nowait(None)
+                return
+            except queue.Full:
+                try:
+                    target_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _put(self, target_queue, packet):
+        while self.app.running:
+            try:
+                target_queue.put(packet, timeout=self.poll_interval)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source_queue):
+        while self.app.running:
+            try:
+                return source_queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+        return None
+
+    def _put_latest(self, target_queue, packet):
+        # Canlı kaynakta tespit kuyruğu doluysa en eski kare atılır, gecikme birikmez
+        while True:
+            try:
+                target_queue.put_nowait(packet)
+                return
+            except queue.Full:
+                try:
+                    target_queue.get_nowait()
+                    self.frames_dropped += 1
+                except queue.Empty:
+                    pass
+
+    def _capture_stage(self):
+        source = self.app.frame_source
+        pacer = self.app.pacer
+        seq = 0
+        while self.app.running:
+            if pacer is not None:
+                pacer.wait()
+            success, frame = source.read()
+            if not success:
+                self.app._log_source_end()
+                self._put(self.detect_queue, None)
+                return
+
+            # Halka tampondaki yuva bir sonraki okumada serbest kalır, bu yüzden çevrilmiş kopya aktarılır
+            packet = FramePacket(seq, source.last_timestamp, self.engine.prepare(frame))
+            if source.is_live:
+                self._put_latest(self.detect_queue, packet)
+            elif not self._put(self.detect_queue, packet):
+                return
+            seq += 1
+
+    def _detect_stage(self):
+        # Dedektör izin veriyorsa (ayrı süreçte tespit) bir karenin sonucu beklenirken sonraki gönderilir
+        max_in_flight = self.engine.hand_detector.max_in_flight
+        in_flight = deque()
+        submit_time = 0.0
+        source_ended = False
+
+        while self.app.running:
+            if not source_ended and len(in_flight) < max_in_flight:
+                # Sonucu beklenen kare varken boş kuyrukta beklenmez
+                if not in_flight or not self.detect_queue.empty():
+                    packet = self._get(self.detect_queue)
+                    if packet is None:
+                        source_ended = True
+                    else:
+                        start_time = time.perf_counter()
+                        self.engine.submit_detection(packet.frame, packet.timestamp)
+                        submit_time += time.perf_counter() - start_time
+                        in_flight.append(packet)
+                        continue
+
+            if in_flight:
+                packet = in_flight.popleft()
+                start_time = time.perf_counter() - submit_time
+                submit_time = 0.0
+                packet.frame, packet.results = self.engine.collect_detection()
+                self._record_stage_time("detect", start_time)
+                self._put(self.update_queue, packet)
+            elif source_ended:
+                self._put(self.update_queue, None)
+                return
+
+    def _update_stage(self):
+        while self.app.running:
+            packet = self._get(self.update_queue)
+
+            # Tuşlar mod ve kanvas durumunu değiştirdiği için yalnızca bu aşamada işlenir
+            while not self.key_queue.empty():
+                self.engine.handle_key(self.key_queue.get_nowait())
+
+            if packet is None:
+                self._put(self.display_queue, None)
+                return
+            start_time = time.perf_counter()
+            packet.frame, packet.status_text, packet.status_color = self.engine.update(
+                packet.frame,
+                packet.results,
+                packet.timestamp
+            )
+            self._record_stage_time("update", start_time)
+            packet.mode = self.engine.current_mode
+            self.app.update_idle(packet.results)
+            self._put(self.display_queue, packet)
+
+    def _display_stage(self):
+        while True:
+            try:
+                packet = self.display_queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                # Kare beklenirken de pencere olayları işlenir, ESC her zaman çalışır
+                if not self.app.running:
+                    break
+                key = cv2.waitKey(1)
+                if not self.app._handle_key_press(key):
+                    self.key_queue.put(key)
+                continue
+            if packet is None or not self.app.running:
+                break
+
+            if packet.seq <= self.last_seq:
+                self.frames_out_of_order += 1
+                continue
+            self.last_seq = packet.seq
+
+            fps = self.app.update_fps()
+            frame = self.app.compose_stage(
+                packet.frame,
+                fps,
+                packet.mode,
+                queue_depths=self.queue_depths()
+            )
+
+            cv2.imshow("AirDraw", frame)
+            key = cv2.waitKey(1)
+            if not self.app._handle_key_press(key):
+                self.key_queue.put(key)
+
+"""
+Bu dosya isteğe bağlı boru hattı (pipeline) çalışma modunu içerir.
+Kamera okuma, el tespiti, mod/kanvas güncelleme ve ekrana çizim ayrı aşamalarda
+çalışır ve aralarında sınırlı kuyruklar vardır. Her kare sıra numarası taşır,
+ekran aşaması sırayı korur. Çok çekirdekli makinelerde hız, tüm aşamaların
+toplamı yerine en yavaş aşama kadar olur. settings.PIPELINED_RUNTIME ile açılır.
+"""
@@ -0,0 +1,231 @@
+"""
+-------------
+Batuhan Korkmaz
+Full Stack Developer & EdTech Girişimcisi
+https://www.linkedin.com/in/batuhanfy/
+--------------
+"""
+
+import multiprocessing
+import queue
+import time
+from collections import deque
+from multiprocessing import shared_memory
+import numpy as np
+from config import settings
+from core.detector_backend import DetectorBackend
+from core.hand_landmarks import (
+    NUM_LANDMARKS, results_to_arrays, results_from_arrays, handedness_score, handedness_label, match_wrists
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def _detector_worker(backend, landmarks_file, shm_name, frames_shape, request_queue, result_queue):
+    from core.detector_backend import create_hand_detector
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray(frames_shape, dtype=np.uint8, buffer=shm.buf)
+    detector = create_hand_detector(backend, landmarks_file, record_file=False, out_of_process=False)
+
+    try:
+        while True:
+            request = request_queue.get()
+            if request is None:
+                break
+
+            command, args = request
+            if command != "detect":
+                # Kalite yöneticisinin ayar değişiklikleri asıl dedektöre iletilir
+                getattr(detector, command)(*args)
+                continue
+
+            seq, slot, timestamp, hint = args
+            if hint is not None:
+                # Diğer işçilerin bulduğu en güncel el konumu takip (ROI, tahmin) için verilir
+                hint_landmarks, hint_scores, hint_labels, hint_timestamp = hint
+                detector.hint(results_from_arrays(hint_landmarks, hint_scores, hint_labels), hint_timestamp)
+
+            start = time.perf_counter()
+            results = detector.detect(frames[slot], timestamp)
+            elapsed = time.perf_counter() - start
+
+            # Geri yalnızca landmark dizileri gönderilir
+            arrays = results_to_arrays(results)
+            landmarks = np.stack(arrays) if arrays else np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+            scores = [handedness_score(results, idx) for idx in range(len(arrays))]
+            labels = [handedness_label(results, idx) for idx in range(len(arrays))]
+            result_queue.put((seq, slot, landmarks, scores, labels, elapsed))
+    finally:
+        detector.close()
+        del frames
+        shm.close()
+
+class ProcessHandDetector(DetectorBackend):
+    def __init__(self, backend="mediapipe", landmarks_file=None, max_hands=2, workers=1, slots=2, timeout=5.0):
+        super().__init__(max_hands)
+        self.backend = backend
+        self.landmarks_file = landmarks_file
+        self.num_workers = max(1, workers)
+        self.slots = slots
+        self.timeout = timeout
+
+        # Her işçinin çift tamponu vardır: bir kare çıkarımdayken bir sonraki yazılabilir.
+        # Boru hattı kare tampon halkasını bu sayı kadar derinleştirir
+        self.max_in_flight = self.num_workers * slots
+        self.free_slots = [deque(range(idx * slots, (idx + 1) * slots)) for idx in range(self.num_workers)]
+        self.in_flight = deque()
+        self.next_seq = 0
+
+        # Farklı işçilerden gelen sonuçlar kare sırasına göre burada toplanır
+        self.reorder_buffer = {}
+        self.max_reordered = 0
+        self.last_hands = None
+
+        self.model_complexity = 1
+        self.detection_scale = settings.DETECTION_SCALE
+        self.detection_interval = settings.DETECTION_INTERVAL
+
+        self.context = multiprocessing.get_context("spawn")
+        self.request_queues = [self.context.Queue() for _ in range(self.num_workers)]
+        self.result_queue = self.context.Queue()
+        self.processes = []
+        self.shm = None
+        self.frames = None
+        self.inference_time = 0.0
+
+    def _start(self, frame_shape):
+        frames_shape = (self.num_workers * self.slots,) + tuple(frame_shape)
+        self.shm = shared_memory.SharedMemory(create=True, size=int(np.prod(frames_shape)))
+        self.frames = np.ndarray(frames_shape, dtype=np.uint8, buffer=self.shm.buf)
+
+        for idx, request_queue in enumerate(self.request_queues):
+            process = self.context.Process(
+                target=_detector_worker,
+                args=(self.backend, self.landmarks_file, self.shm.name, frames_shape,
+                      request_queue, self.result_queue),
+                name=f"airdraw-detector-{idx + 1}",
+                daemon=True
+            )
+            process.start()
+            self.processes.append(process)
+        logger.info(
+            f"El tespiti {self.num_workers} ayrı süreçte başlatıldı "
+            f"(işçi başına {self.slots} tampon, {frame_shape[1]}x{frame_shape[0]})"
+        )
+
+    def _send(self, frame, timestamp):
+        if not self.processes:
+            self._start(frame.shape)
+        if frame.shape != self.frames.shape[1:]:
+            raise ValueError(f"Kare boyutu değişti: {frame.shape} != {self.frames.shape[1:]}")
+
+        # Ardışık kareler işçilere sırayla dağıtılır
+        seq = self.next_seq
+        worker_idx = seq % self.num_workers
+        if not self.free_slots[worker_idx]:
+            raise RuntimeError("Boş tampon yok, önce collect() çağrılmalı")
+        self.next_seq += 1
+
+        slot = self.free_slots[worker_idx].popleft()
+        np.copyto(self.frames[slot], frame)
+        hint = self.last_hands if self.num_workers > 1 else None
+        self.request_queues[worker_idx].put(("detect", (seq, slot, timestamp, hint)))
+        return seq
+
+    def _receive(self, seq):
+        while seq not in self.reorder_buffer:
+            try:
+                item = self.result_queue.get(timeout=self.timeout)
+            except queue.Empty:
+                raise RuntimeError("El tespit süreci yanıt vermiyor")
+            self.reorder_buffer[item[0]] = item
+            self.max_reordered = max(self.max_reordered, len(self.reorder_buffer))
+
+        _, slot, landmarks, scores, labels, elapsed = self.reorder_buffer.pop(seq)
+        self.free_slots[slot // self.slots].append(slot)
+        self.inference_time = elapsed
+        return landmarks, scores, labels
+
+    def _assemble(self, landmarks, scores, labels, timestamp):
+        if self.num_workers > 1:
+            landmarks, scores, labels = self._match_hands(landmarks, scores, labels)
+        self.last_hands = (landmarks, scores, labels, timestamp)
+        return results_from_arrays(landmarks, scores, labels)
+
+    def _match_hands(self, landmarks, scores, labels):
+        # İşçiler elleri farklı sırada bulabilir; sıra bir önceki karedeki bilek konumuna göre korunur
+        if self.last_hands is None or len(landmarks) < 2 or len(self.last_hands[0]) == 0:
+            return landmarks, scores, labels
+
+        assignment = match_wrists(self.last_hands[0][:, 0], landmarks[:, 0])
+        order = sorted(range(len(landmarks)), key=lambda idx: (assignment[idx] == -1, assignment[idx]))
+
+        return landmarks[order], [scores[idx] for idx in order], [labels[idx] for idx in order]
+
+    def detect(self, frame, timestamp):
+        seq = self._send(frame, timestamp)
+        return self._assemble(*self._receive(seq), timestamp)
+
+    def submit(self, frame, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        start = time.perf_counter()
+        seq = self._send(frame, timestamp)
+        self.in_flight.append((seq, frame, timestamp, start))
+
+    def collect(self, draw=True):
+        seq, frame, timestamp, start = self.in_flight.popleft()
+        results = self._assemble(*self._receive(seq), timestamp)
+        return self._finish(frame, results, timestamp, draw, start)
+
+    def _command(self, name, *args):
+        for request_queue in self.request_queues:
+            request_queue.put((name, args))
+
+    def reset(self):
+        self.last_hands = None
+        self._command("reset")
+
+    def set_model_complexity(self, model_complexity):
+        self.model_complexity = model_complexity
+        self._command("set_model_complexity", model_complexity)
+
+    def set_detection_interval(self, interval):
+        self.detection_interval = max(1, int(interval))
+        self._command("set_detection_interval", interval)
+
+    def set_detection_scale(self, scale):
+        self.detection_scale = min(1.0, max(0.1, scale))
+        self._command("set_detection_scale", scale)
+
+    def close(self):
+        for request_queue in self.request_queues:
+            request_queue.put(None)
+        for process in self.processes:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+        self.processes = []
+
+        if self.shm is not None:
+            self.frames = None
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+        super().close()
+
+"""
+El tespitini ayrı süreçlerde çalıştıran dedektör. MediaPipe çıkarımı ile
+çizim kodu aynı yorumlayıcıyı (GIL) paylaşmaz. Kareler
+multiprocessing.shared_memory üzerindeki tamponlara kopyalanır (her işçiye
+iki yuva), geri yalnızca landmark dizileri döner. submit/collect ile N+1.
+kare tespit edilirken N. kare ana süreçte modlardan geçirilip
+birleştirilebilir; boru hattı modu (PIPELINED_RUNTIME) bunu kullanır.
+
+DETECTOR_WORKERS > 1 ise ardışık kareler işçilere sırayla dağıtılır ve
+sonuçlar sınırlı bir sıralama tamponunda kare sırasına dizilir. Takip
+sürekliliği için her isteğe en güncel el konumu ipucu olarak eklenir ve
+ellerin sırası bilek konumuna göre korunur. settings.DETECTOR_PROCESS ile
+açılır, modların kodunda değişiklik gerekmez.
+"""
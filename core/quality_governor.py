@@ -0,0 +1,97 @@
+"""
+-------------
+Batuhan Korkmaz
+Full Stack Developer & EdTech Girişimcisi
+https://www.linkedin.com/in/batuhanfy/
+--------------
+"""
+
+import time
+from config import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class QualityGovernor:
+    def __init__(self, engine, target_fps=settings.FPS_LIMIT, levels=settings.QUALITY_LEVELS,
+                 degrade_ratio=1.1, upgrade_ratio=0.75, hold_frames=30, cooldown=2.0):
+        self.engine = engine
+        self.detector = engine.hand_detector
+        self.target_frame_time = 1.0 / target_fps
+        self.degrade_ratio = degrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.hold_frames = hold_frames
+        self.cooldown = cooldown
+
+        # 0. seviye kullanıcının ayarladığı başlangıç kalitesidir
+        self.levels = [self._current_config()] + list(levels)
+        self.level = 0
+
+        self.slow_frames = 0
+        self.fast_frames = 0
+        self.upgrade_hold = hold_frames * 2
+        self.last_change_time = 0.0
+        self.last_change_was_upgrade = False
+
+    def _current_config(self):
+        return {
+            "model_complexity": self.detector.model_complexity,
+            "detection_scale": self.detector.detection_scale,
+            "detection_interval": self.detector.detection_interval,
+            "draw_landmarks": self.engine.draw_landmarks
+        }
+
+    def update(self, frame_time, now=None):
+        if frame_time <= 0:
+            return self.level
+        now = time.time() if now is None else now
+
+        if frame_time > self.target_frame_time * self.degrade_ratio:
+            self.slow_frames += 1
+            self.fast_frames = 0
+        elif frame_time < self.target_frame_time * self.upgrade_ratio:
+            self.fast_frames += 1
+            self.slow_frames = 0
+        else:
+            self.slow_frames = 0
+            self.fast_frames = 0
+
+        if now - self.last_change_time < self.cooldown:
+            return self.level
+
+        if self.slow_frames >= self.hold_frames and self.level < len(self.levels) - 1:
+            # Yükseltmeden hemen sonra tekrar düşüyorsa bir sonraki yükseltme için daha uzun beklenir
+            if self.last_change_was_upgrade and now - self.last_change_time < self.cooldown * 3:
+                self.upgrade_hold = min(self.upgrade_hold * 2, self.hold_frames * 32)
+            self._apply(self.level + 1, now, upgrade=False)
+        elif self.fast_frames >= self.upgrade_hold and self.level > 0:
+            self._apply(self.level - 1, now, upgrade=True)
+        elif self.fast_frames >= self.upgrade_hold * 4:
+            self.upgrade_hold = self.hold_frames * 2
+
+        return self.level
+
+    def _apply(self, level, now, upgrade):
+        config = self.levels[level]
+        self.detector.set_model_complexity(config["model_complexity"])
+        self.detector.set_detection_scale(config["detection_scale"])
+        self.detector.set_detection_interval(config["detection_interval"])
+        self.engine.draw_landmarks = config["draw_landmarks"]
+
+        self.level = level
+        self.slow_frames = 0
+        self.fast_frames = 0
+        self.last_change_time = now
+        self.last_change_was_upgrade = upgrade
+        logger.info(f"Kalite seviyesi {level}: {config}")
+
+"""
+Uyarlanabilir kalite yöneticisi. Kameradan okuma ve hız sınırlayıcının uykusu
+hariç yumuşatılmış işleme süresine bakar: seri döngüde tespit + güncelleme
+süresi (AirDrawApp.process_time), boru hattında en yavaş aşamanın süresi
+(FramePipeline.bottleneck_time). settings.FPS_LIMIT hedefini tutturmak için
+model karmaşıklığı, tespit ölçeği, tespit aralığı ve landmark çizimini seviye
+seviye değiştirir. Düşürme ve
+yükseltme eşikleri farklıdır, değişiklikler arasında bekleme süresi vardır ve
+başarısız yükseltmelerden sonra bekleme uzar; böylece ayarlar salınım yapmaz.
+"""
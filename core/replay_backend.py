@@ -0,0 +1,105 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import os
+import numpy as np
+from core.detector_backend import DetectorBackend
+from core.hand_landmarks import (
+    DetectionResults, NUM_LANDMARKS, results_to_arrays, results_from_arrays,
+    handedness_score, handedness_label
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class LandmarkRecorder:
+    def __init__(self, path):
+        # np.savez uzantıyı kendisi ekler; okurken aynı adın kullanılabilmesi için baştan eklenir
+        self.path = path if path.endswith(".npz") else path + ".npz"
+        self.timestamps = []
+        self.counts = []
+        self.landmarks = []
+        self.scores = []
+        self.labels = []
+
+    def record(self, results, timestamp):
+        arrays = results_to_arrays(results)
+        self.timestamps.append(timestamp)
+        self.counts.append(len(arrays))
+        for hand_idx, array in enumerate(arrays):
+            self.landmarks.append(array)
+            self.scores.append(handedness_score(results, hand_idx))
+            self.labels.append(handedness_label(results, hand_idx))
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        landmarks = np.array(self.landmarks, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+        np.savez_compressed(
+            self.path,
+            timestamps=np.array(self.timestamps, dtype=np.float64),
+            counts=np.array(self.counts, dtype=np.int32),
+            landmarks=landmarks,
+            scores=np.array(self.scores, dtype=np.float32),
+            labels=np.array(self.labels, dtype=str)
+        )
+        logger.info(f"Landmark kaydı yazıldı: {self.path} ({len(self.counts)} kare)")
+
+class ReplayBackend(DetectorBackend):
+    def __init__(self, path, max_hands=2, loop=True, sync_timestamps=False):
+        super().__init__(max_hands)
+        if not path or not os.path.exists(path):
+            raise ValueError(f"Landmark kaydı bulunamadı: {path}")
+
+        with np.load(path) as data:
+            self.timestamps = data["timestamps"]
+            self.counts = data["counts"]
+            self.landmarks = data["landmarks"]
+            self.scores = data["scores"]
+            self.labels = data["labels"]
+
+        self.offsets = np.concatenate([[0], np.cumsum(self.counts)])
+        self.loop = loop
+        self.sync_timestamps = sync_timestamps
+        self.position = 0
+        logger.info(f"Landmark kaydı yüklendi: {path} ({len(self.counts)} kare)")
+
+    def detect(self, frame, timestamp):
+        frame_idx = self._next_index(timestamp)
+        if frame_idx is None or self.counts[frame_idx] == 0:
+            return DetectionResults()
+
+        start = self.offsets[frame_idx]
+        end = min(self.offsets[frame_idx + 1], start + self.max_hands)
+        return results_from_arrays(self.landmarks[start:end], self.scores[start:end], self.labels[start:end])
+
+    def _next_index(self, timestamp):
+        if self.sync_timestamps and len(self.timestamps):
+            # Kayıt alınan videoyla birlikte oynatılırken kareler zaman damgasıyla eşleştirilir
+            frame_idx = int(np.searchsorted(self.timestamps, timestamp, side="right")) - 1
+            return max(frame_idx, 0)
+
+        if self.position >= len(self.counts):
+            if not self.loop or not len(self.counts):
+                return None
+            self.position = 0
+        frame_idx = self.position
+        self.position += 1
+        return frame_idx
+
+    def reset(self):
+        self.position = 0
+
+# -----------------------------------------------------------------
+# Kaydedilmiş landmark'ları tekrar oynatan arka uç. LandmarkRecorder herhangi
+# bir arka ucun sonuçlarını .npz dosyasına yazar (--record-landmarks),
+# ReplayBackend bunları kare kare geri verir. Görüntü işlenmediği için kanvas,
+# modlar ve birleştirme kodu çıkarım olmadan saniyede binlerce karede
+# ölçülebilir. sync_timestamps ile kayıt, aynı videonun zaman damgalarına
+# göre eşleştirilir.
+# -----------------------------------------------------------------
@@ -0,0 +1,78 @@
+"""
+-------------
+Batuhan Korkmaz
+Full Stack Developer & EdTech Girişimcisi
+https://www.linkedin.com/in/batuhanfy/
+--------------
+"""
+
+import time
+from config import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class FramePacer:
+    def __init__(self, target_fps=settings.FPS_LIMIT, spin_margin=settings.PACER_SPIN_MARGIN):
+        self.spin_margin = spin_margin
+        self.frame_interval = 1.0 / target_fps
+        self.deadline = None
+
+    def set_target_fps(self, target_fps):
+        self.frame_interval = 1.0 / target_fps
+        self.deadline = None
+
+    def wait(self):
+        now = time.perf_counter()
+        if self.deadline is None or now - self.deadline > self.frame_interval:
+            # Bir kareden fazla geride kalındıysa yetişmek için art arda kare üretilmez
+            self.deadline = now
+        else:
+            # Uyku kaba ayarlıdır; son birkaç milisaniye meşgul beklemeyle tamamlanır
+            remaining = self.deadline - now
+            if remaining > self.spin_margin:
+                time.sleep(remaining - self.spin_margin)
+            while time.perf_counter() < self.deadline:
+                pass
+
+        self.deadline += self.frame_interval
+
+class IdleScheduler:
+    def __init__(self, pacer, frame_source, active_fps=settings.FPS_LIMIT,
+                 idle_fps=settings.IDLE_FPS, idle_timeout=settings.IDLE_TIMEOUT):
+        self.pacer = pacer
+        self.frame_source = frame_source
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_timeout = idle_timeout
+        self.idle = False
+        self.last_hand_time = time.time()
+
+    def update(self, hand_seen, now=None):
+        now = time.time() if now is None else now
+
+        if hand_seen:
+            self.last_hand_time = now
+            if self.idle:
+                self._set_idle(False)
+        elif not self.idle and now - self.last_hand_time > self.idle_timeout:
+            self._set_idle(True)
+        return self.idle
+
+    def _set_idle(self, idle):
+        self.idle = idle
+        fps = self.idle_fps if idle else self.active_fps
+        self.pacer.set_target_fps(fps)
+        self.frame_source.set_max_rate(self.idle_fps if idle else None)
+        if idle:
+            logger.info(f"El görülmüyor, bekleme moduna geçildi ({fps} FPS)")
+        else:
+            logger.info(f"El algılandı, tam hıza dönüldü ({fps} FPS)")
+
+"""
+Kare hızı sınırlayıcı ve boşta güç tasarrufu. FramePacer döngüyü hedef FPS'te
+tutar: çoğunu uykuyla, son kısmı kısa bir meşgul beklemeyle geçirir.
+IdleScheduler belirli bir süre el görülmezse
+tespit ve kamera okuma hızını birkaç Hz'e düşürür, el görünür görünmez tam
+hıza döner. Sınıf kullanılan bilgisayarlar gün boyu açık kaldığı için eklendi.
+"""
@@ -0,0 +1,293 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import time
+import cv2
+import numpy as np
+
+def _scaled(value, scale):
+    return int(round(value * scale))
+
+def _to_view(point, scale, origin):
+    return (_scaled(point[0] - origin[0], scale), _scaled(point[1] - origin[1], scale))
+
+def _scaled_thickness(thickness, scale):
+    return thickness if thickness < 0 else max(1, _scaled(thickness, scale))
+
+class Stroke:
+    __slots__ = ("color", "thickness", "erase", "start_time", "start", "points", "times", "count")
+
+    def __init__(self, point, color, thickness, timestamp, erase=False, capacity=32):
+        self.color = color
+        self.thickness = thickness
+        self.erase = erase
+        self.start_time = timestamp
+        # Noktalar ilk noktaya göre int16, zamanlar vuruş başına göre float32 olarak
+        # büyüyen dizilerde tutulur; sonsuz kanvasta uzak koordinatlar da sığar
+        self.start = (int(point[0]), int(point[1]))
+        self.points = np.empty((capacity, 2), dtype=np.int16)
+        self.times = np.empty(capacity, dtype=np.float32)
+        self.count = 0
+        self.append(point, timestamp)
+
+    def append(self, point, timestamp):
+        if self.count == len(self.points):
+            self.points = np.resize(self.points, (self.count * 2, 2))
+            self.times = np.resize(self.times, self.count * 2)
+        self.points[self.count] = np.clip((point[0] - self.start[0], point[1] - self.start[1]), -32768, 32767)
+        self.times[self.count] = timestamp - self.start_time
+        self.count += 1
+
+    def last_point(self):
+        x, y = self.points[self.count - 1]
+        return (int(x) + self.start[0], int(y) + self.start[1])
+
+    def render(self, canvas, scale=1.0, origin=(0, 0)):
+        points = self.points[:self.count].astype(np.int32)
+        points += (self.start[0] - origin[0], self.start[1] - origin[1])
+        if scale != 1.0:
+            points = np.rint(points * scale).astype(np.int32)
+        cv2.polylines(canvas, [points], False, self.color, _scaled_thickness(self.thickness, scale))
+        if self.erase:
+            # Silgi her noktada uç yuvarlağı da bırakır
+            radius = max(1, _scaled(self.thickness // 2, scale))
+            for x, y in points[1:]:
+                cv2.circle(canvas, (int(x), int(y)), radius, self.color, -1)
+
+    @property
+    def nbytes(self):
+        return self.count * (self.points.itemsize * 2 + self.times.itemsize)
+
+class Shape:
+    __slots__ = ("kind", "params", "color", "thickness")
+
+    def __init__(self, kind, params, color, thickness):
+        self.kind = kind
+        self.params = np.array(params, dtype=np.int32)
+        self.color = color
+        self.thickness = thickness
+
+    def render(self, canvas, scale=1.0, origin=(0, 0)):
+        values = self.params.tolist()
+        thickness = _scaled_thickness(self.thickness, scale)
+        if self.kind == "rectangle":
+            cv2.rectangle(canvas, _to_view(values[0:2], scale, origin), _to_view(values[2:4], scale, origin),
+                          self.color, thickness)
+        elif self.kind == "circle":
+            cv2.circle(canvas, _to_view(values[0:2], scale, origin), _scaled(values[2], scale), self.color, thickness)
+
+    @property
+    def nbytes(self):
+        return self.params.nbytes
+
+class Text:
+    __slots__ = ("text", "position", "color", "font_scale", "thickness")
+
+    def __init__(self, text, position, color, font_scale, thickness):
+        self.text = text
+        self.position = position
+        self.color = color
+        self.font_scale = font_scale
+        self.thickness = thickness
+
+    def render(self, canvas, scale=1.0, origin=(0, 0)):
+        cv2.putText(
+            canvas,
+            self.text,
+            _to_view(self.position, scale, origin),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            self.font_scale * scale,
+            self.color,
+            _scaled_thickness(self.thickness, scale)
+        )
+
+    @property
+    def nbytes(self):
+        return len(self.text.encode("utf-8"))
+
+class Paste:
+    __slots__ = ("position", "image", "mask")
+
+    def __init__(self, position, image, mask=None):
+        # Taşınan seçim vektör değildir; görüntü parçası saklanır. Yalnızca maskenin
+        # kapladığı dikdörtgen kopyalanır, tamamen dolu maske hiç tutulmaz
+        if mask is not None:
+            rows = np.flatnonzero(mask.any(axis=1))
+            cols = np.flatnonzero(mask.any(axis=0))
+            if len(rows) == 0:
+                image, mask = image[:0, :0], mask[:0, :0]
+            else:
+                image = image[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+                mask = mask[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+                position = (position[0] + int(cols[0]), position[1] + int(rows[0]))
+            if mask.all():
+                mask = None
+        self.position = position
+        self.image = image.copy()
+        self.mask = None if mask is None else mask.copy()
+
+    def render(self, canvas, scale=1.0, origin=(0, 0)):
+        image, mask = self.image, self.mask
+        if image.size == 0:
+            return
+        x1, y1 = _to_view(self.position, scale, origin)
+        if scale != 1.0:
+            size = (max(1, _scaled(image.shape[1], scale)), max(1, _scaled(image.shape[0], scale)))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+            if mask is not None:
+                mask = cv2.resize(mask.astype(np.uint8), size, interpolation=cv2.INTER_NEAREST).astype(bool)
+
+        height, width = canvas.shape[:2]
+        cx1, cy1 = max(0, x1), max(0, y1)
+        cx2, cy2 = min(width, x1 + image.shape[1]), min(height, y1 + image.shape[0])
+        if cx1 >= cx2 or cy1 >= cy2:
+            return
+        image = image[cy1 - y1:cy2 - y1, cx1 - x1:cx2 - x1]
+        region = canvas[cy1:cy2, cx1:cx2]
+        if mask is None:
+            region[...] = image
+        else:
+            mask = mask[cy1 - y1:cy2 - y1, cx1 - x1:cx2 - x1]
+            region[mask] = image[mask]
+
+    @property
+    def nbytes(self):
+        return self.image.nbytes + (0 if self.mask is None else self.mask.nbytes)
+
+class Clear:
+    __slots__ = ()
+
+    def render(self, canvas, scale=1.0, origin=(0, 0)):
+        canvas.fill(0)
+
+    @property
+    def nbytes(self):
+        return 0
+
+class StrokeDocument:
+    def __init__(self, recording=True):
+        # recording kapalıysa kayıt tutulmaz; kaynağı kendi deposu olan kanvaslar içindir
+        self.recording = recording
+        # Her grup bir geri alma adımıdır; cursor'dan sonrası yinelenebilir gruplardır
+        self.groups = []
+        self.cursor = 0
+        self.open_items = []
+        # Geri alınamayacak kadar eski gruplar tek bir taban görüntüsüne indirgenir
+        self.base = None
+
+    def add_line(self, point1, point2, color, thickness, timestamp=None, erase=False):
+        if not self.recording:
+            return
+        timestamp = time.time() if timestamp is None else timestamp
+        last = self.open_items[-1] if self.open_items else None
+        # Aynı kalemle bir önceki çizginin ucundan devam eden parça aynı vuruşa eklenir
+        if (isinstance(last, Stroke) and last.erase == erase and last.color == color
+                and last.thickness == thickness and last.last_point() == tuple(point1)):
+            last.append(point2, timestamp)
+        else:
+            stroke = Stroke(point1, color, thickness, timestamp, erase)
+            stroke.append(point2, timestamp)
+            self.open_items.append(stroke)
+
+    def add_shape(self, kind, params, color, thickness):
+        if self.recording:
+            self.open_items.append(Shape(kind, params, color, thickness))
+
+    def add_text(self, text, position, color, font_scale, thickness):
+        if self.recording:
+            self.open_items.append(Text(text, tuple(position), color, font_scale, thickness))
+
+    def add_paste(self, position, image, mask=None):
+        if self.recording:
+            self.open_items.append(Paste(tuple(position), image, mask))
+
+    def add_clear(self):
+        if self.recording:
+            self.open_items.append(Clear())
+
+    def commit(self):
+        if not self.open_items:
+            return False
+        del self.groups[self.cursor:]
+        self.groups.append(self.open_items)
+        self.cursor += 1
+        self.open_items = []
+        return True
+
+    def discard(self):
+        self.open_items = []
+
+    def undo(self):
+        if self.cursor == 0:
+            return False
+        self.cursor -= 1
+        return True
+
+    def redo(self):
+        if self.cursor >= len(self.groups):
+            return False
+        self.cursor += 1
+        return True
+
+    def flatten(self, count, width, height, origin=(0, 0)):
+        # Geçmişten düşen en eski gruplar tabana çizilir ve vektör olarak tutulmaz
+        count = min(count, len(self.groups))
+        if count <= 0:
+            return
+        canvas = np.zeros((height, width, 3), dtype=np.uint8)
+        for item in self._visible(self.groups[:count]):
+            item.render(canvas, 1.0, origin)
+        del self.groups[:count]
+        self.cursor = max(0, self.cursor - count)
+        self.base = Paste(origin, canvas) if canvas.any() else None
+
+    def _visible(self, groups):
+        # Son temizlemeden önceki gruplar (ve taban) görünmez, çizilmeleri gerekmez
+        start = 0
+        for idx in range(len(groups) - 1, -1, -1):
+            if any(isinstance(item, Clear) for item in groups[idx]):
+                start = idx
+                break
+        if start == 0 and self.base is not None:
+            yield self.base
+        for group in groups[start:]:
+            yield from group
+
+    def items(self):
+        yield from self._visible(self.groups[:self.cursor])
+        yield from self.open_items
+
+    def rasterize(self, width, height, scale=1.0, origin=(0, 0), canvas=None):
+        if canvas is None:
+            canvas = np.zeros((height, width, 3), dtype=np.uint8)
+        for item in self.items():
+            item.render(canvas, scale, origin)
+        return canvas
+
+    @property
+    def open_nbytes(self):
+        return sum(item.nbytes for item in self.open_items)
+
+    @property
+    def nbytes(self):
+        base_nbytes = 0 if self.base is None else self.base.nbytes
+        return base_nbytes + sum(item.nbytes for group in self.groups for item in group)
+
+    def __len__(self):
+        return sum(len(group) for group in self.groups[:self.cursor])
+
+# -----------------------------------------------------------------
+# Kanvastaki çizimlerin vektör kaydı. Serbest çizgiler int16 nokta ve float32
+# zaman dizileri, dikdörtgen/daire Shape, temizleme Clear, yazılar Text kaydı olarak
+# tutulur. Taşınan seçimler görüntü parçası (Paste) olarak saklanır. Kanvas
+# dizisi bu belgenin artımlı güncellenen önbelleğidir ve rasterize ile
+# istenen ölçekte ve konumda yeniden üretilebilir. Koordinatlar dünya
+# koordinatlarıdır, sonsuz kanvasta görünümün kaydırılması belgeyi etkilemez. Gruplar kanvasın geri alma adımlarıyla
+# birebir eşleşir, cursor geri alma/yinelemeyle birlikte ilerler. Geçmişten
+# düşen gruplar flatten ile tek bir taban görüntüsüne indirgenir, böylece belge
+# de geçmiş bütçesiyle sınırlı kalır. Sonsuz kanvas belgeyi kayıtsız
+# (recording=False) açar; orada kaynak karo deposudur.
+# -----------------------------------------------------------------
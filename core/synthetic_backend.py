@@ -0,0 +1,111 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import math
+import numpy as np
+from core.detector_backend import DetectorBackend
+from core.hand_landmarks import LandmarkList, Handedness, DetectionResults, NUM_LANDMARKS
+from core.hand_state import THUMB, INDEX, MIDDLE, RING, PINKY, ALL_FINGERS
+
+# Bilek orijinde, el boyu 1 birim; y aşağı doğru artar
+_WRIST = (0.0, 0.0)
+_THUMB_BASE = [(-0.15, -0.1), (-0.3, -0.2)]
+_THUMB_UP = [(-0.4, -0.3), (-0.48, -0.4)]
+_THUMB_DOWN = [(-0.35, -0.3), (-0.25, -0.25)]
+_FINGER_BASES = [(-0.2, -0.5), (-0.05, -0.52), (0.1, -0.5), (0.24, -0.45)]
+_FINGER_UP = [(0.0, -0.2), (0.0, -0.32), (0.0, -0.42)]
+_FINGER_DOWN = [(0.0, -0.15), (0.0, -0.05), (0.0, 0.02)]
+
+def hand_template(mask):
+    points = [_WRIST] + _THUMB_BASE + (_THUMB_UP if mask & THUMB else _THUMB_DOWN)
+    for finger_bit, (base_x, base_y) in zip((INDEX, MIDDLE, RING, PINKY), _FINGER_BASES):
+        joints = _FINGER_UP if mask & finger_bit else _FINGER_DOWN
+        points.append((base_x, base_y))
+        points.extend((base_x + dx, base_y + dy) for dx, dy in joints)
+
+    template = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+    template[:, :2] = points
+    return template
+
+def line_segment(start, end, duration, mask=INDEX):
+    return (duration, mask, start, end)
+
+def circle_segments(center, radius, duration, mask=INDEX, steps=36):
+    points = [
+        (center[0] + radius * math.cos(2 * math.pi * step / steps),
+         center[1] + radius * math.sin(2 * math.pi * step / steps))
+        for step in range(steps + 1)
+    ]
+    return [(duration / steps, mask, start, end) for start, end in zip(points, points[1:])]
+
+# Varsayılan senaryo: kare ve daire çizer, silgiyle üzerinden geçer, el açık bekler
+DEFAULT_SCRIPT = (
+    [line_segment((0.3, 0.3), (0.3, 0.3), 0.5, INDEX | MIDDLE | RING | PINKY)] +
+    [line_segment(start, end, 0.5) for start, end in [
+        ((0.3, 0.3), (0.5, 0.3)), ((0.5, 0.3), (0.5, 0.5)),
+        ((0.5, 0.5), (0.3, 0.5)), ((0.3, 0.5), (0.3, 0.3))
+    ]] +
+    circle_segments((0.65, 0.45), 0.12, 2.0) +
+    [line_segment((0.25, 0.4), (0.55, 0.4), 1.0, INDEX | MIDDLE)] +
+    [line_segment((0.55, 0.4), (0.55, 0.4), 1.0, ALL_FINGERS)]
+)
+
+class SyntheticBackend(DetectorBackend):
+    def __init__(self, script=DEFAULT_SCRIPT, max_hands=2, hand_size=0.25, loop=True, label="Right"):
+        super().__init__(max_hands)
+        self.script = list(script)
+        self.hand_size = hand_size
+        self.loop = loop
+        self.label = label
+
+        self.durations = np.array([segment[0] for segment in self.script], dtype=np.float64)
+        self.ends = np.cumsum(self.durations)
+        self.total_duration = float(self.ends[-1]) if len(self.ends) else 0.0
+        self.templates = {}
+        self.start_time = None
+
+    def detect(self, frame, timestamp):
+        if self.start_time is None:
+            self.start_time = timestamp
+        elapsed = timestamp - self.start_time
+
+        if self.total_duration <= 0 or (elapsed >= self.total_duration and not self.loop):
+            return DetectionResults()
+        elapsed %= self.total_duration
+
+        segment_idx = min(int(np.searchsorted(self.ends, elapsed, side="right")), len(self.script) - 1)
+        duration, mask, start, end = self.script[segment_idx]
+        progress = 1.0 - (self.ends[segment_idx] - elapsed) / duration if duration > 0 else 1.0
+        target_x = start[0] + (end[0] - start[0]) * progress
+        target_y = start[1] + (end[1] - start[1]) * progress
+
+        height, width = frame.shape[:2]
+        landmarks = self._template(mask, width, height).copy()
+        # İşaret parmağının ucu senaryodaki noktaya taşınır
+        landmarks[:, 0] += target_x - landmarks[8, 0]
+        landmarks[:, 1] += target_y - landmarks[8, 1]
+        return DetectionResults([LandmarkList.from_array(landmarks)], [Handedness(self.label)])
+
+    def _template(self, mask, width, height):
+        key = (mask, width, height)
+        template = self.templates.get(key)
+        if template is None:
+            # Normalize koordinatlarda el oranı korunur, bu yüzden x ekseni en-boy oranıyla ölçeklenir
+            template = hand_template(mask) * self.hand_size
+            template[:, 0] *= height / width
+            self.templates[key] = template
+        return template
+
+    def reset(self):
+        self.start_time = None
+
+# -----------------------------------------------------------------
+# Senaryoya göre yapay el üreten arka uç. Senaryo (süre, parmak maskesi,
+# başlangıç, bitiş) parçalarından oluşur; her parçada verilen pozdaki el,
+# işaret parmağının ucu başlangıçtan bitişe doğrusal ilerleyecek şekilde
+# yerleştirilir. Kamera ya da model olmadan modları ve kanvası denemek,
+# tekrarlanabilir performans ölçümleri almak için kullanılır.
+# -----------------------------------------------------------------
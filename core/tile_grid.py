@@ -0,0 +1,69 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import numpy as np
+from config import settings
+
+class TileGrid:
+    def __init__(self, width, height, tile_size=settings.CANVAS_TILE_SIZE):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.rows = (height + tile_size - 1) // tile_size
+        self.cols = (width + tile_size - 1) // tile_size
+
+        # dirty: son update_ink'ten beri değişen karolar, ink: içinde çizim olan karolar
+        self.dirty = np.zeros((self.rows, self.cols), dtype=bool)
+        self.ink = np.zeros((self.rows, self.cols), dtype=bool)
+        self.frame_dirty = []
+
+    def tile_range(self, x1, y1, x2, y2):
+        size = self.tile_size
+        return y1 // size, (y2 - 1) // size + 1, x1 // size, (x2 - 1) // size + 1
+
+    def tile_rect(self, row, col):
+        size = self.tile_size
+        return (col * size, row * size,
+                min(self.width, (col + 1) * size), min(self.height, (row + 1) * size))
+
+    def mark(self, x1, y1, x2, y2):
+        row1, row2, col1, col2 = self.tile_range(x1, y1, x2, y2)
+        self.dirty[row1:row2, col1:col2] = True
+
+    def mark_all(self):
+        self.dirty[...] = True
+
+    def update_ink(self, canvas):
+        # Sadece değişen karolar taranır; çizimsiz kanvasta maliyet sıfıra yakındır
+        rows, cols = np.nonzero(self.dirty)
+        self.frame_dirty = list(zip(rows.tolist(), cols.tolist()))
+        for row, col in self.frame_dirty:
+            x1, y1, x2, y2 = self.tile_rect(row, col)
+            self.ink[row, col] = canvas[y1:y2, x1:x2].any()
+        self.dirty[...] = False
+        return self.frame_dirty
+
+    def ink_tiles(self):
+        rows, cols = np.nonzero(self.ink)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def ink_bounds(self):
+        rows = np.flatnonzero(self.ink.any(axis=1))
+        if len(rows) == 0:
+            return None
+        cols = np.flatnonzero(self.ink.any(axis=0))
+        size = self.tile_size
+        return (int(cols[0]) * size, int(rows[0]) * size,
+                min(self.width, (int(cols[-1]) + 1) * size), min(self.height, (int(rows[-1]) + 1) * size))
+
+# -----------------------------------------------------------------
+# Kanvasın 64x64 karolara bölünmüş kayıt tablosu. Piksel verisi OpenCV ile
+# çizilebilsin diye tek parça dizide kalır, karo tablosu yalnızca hangi
+# karoların değiştiğini (dirty) ve hangilerinde çizim olduğunu (ink) tutar.
+# Birleştirme, geri alma geçmişi ve ileride kayıt/senkron gibi işler tüm
+# kare yerine sadece bu karolara bakabilir. frame_dirty son karede değişen
+# karoların listesidir.
+# -----------------------------------------------------------------
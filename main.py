@@ -4,10 +4,42 @@
 # https://www.linkedin.com/in/batuhanfy/  
 # -----------------------------------------------------------------  
  
+import argparse
+from config import settings
 from core.app import AirDrawApp  
+from core.multi_session import MultiCameraApp
+from core.detector_backend import create_hand_detector
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="AirDraw")
+    parser.add_argument("--source", action="append", default=None,
+                        help="Kamera numarası, video dosyası ya da görüntü klasörü (birden fazla verilebilir)")
+    parser.add_argument("--sink", choices=["tile", "windows"], default=None,
+                        help="Birden fazla kaynakta çıktıların gösterimi")
+    parser.add_argument("--fast", action="store_true", help="Kayıtları bekleme yapmadan olabildiğince hızlı oynat")
+    parser.add_argument("--backend", choices=["mediapipe", "replay", "synthetic"], default=None,
+                        help="El tespit arka ucu")
+    parser.add_argument("--landmarks", default=None, help="replay arka ucu için landmark kaydı (.npz)")
+    parser.add_argument("--record-landmarks", default=None, help="Tespit edilen landmark'ları bu dosyaya kaydet")
+    return parser.parse_args()
 
 def main():   
-    app = AirDrawApp()  
+    args = parse_args()
+    sources = args.source or [None]
+    if len(sources) > 1:
+        # Oturumlar aynı kayıt dosyasına yazamaz
+        if args.record_landmarks:
+            raise SystemExit("--record-landmarks birden fazla kaynakla kullanılamaz")
+        app = MultiCameraApp(
+            sources,
+            sink=args.sink or settings.MULTI_SESSION_SINK,
+            realtime=not args.fast,
+            backend=args.backend,
+            landmarks_file=args.landmarks
+        )
+    else:
+        hand_detector = create_hand_detector(args.backend, args.landmarks, args.record_landmarks)
+        app = AirDrawApp(source=sources[0], realtime=not args.fast, hand_detector=hand_detector)  
     app.run()  
 
 if __name__ == "__main__":  
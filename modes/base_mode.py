@@ -13,11 +13,14 @@ class BaseMode:
         self.status_text = "Base Mode Active"  
         self.status_color = (255, 255, 255)  
         self.mp_hands = mp.solutions.hands  
+        # Modun sahip olduğu parmak maskeleri; None ise her pozda check_activation sorulur  
+        self.poses = None  
+        self.pose_predicate = None  
     
-    def check_activation(self, hand_landmarks, width, height):  
+    def check_activation(self, hand, width, height):  
         return False  
     
-    def process(self, frame, hand_landmarks, width, height):  
+    def process(self, frame, hand, width, height):  
         return frame, self.status_text, self.status_color  
     
     def handle_key_press(self, key):  
@@ -26,10 +29,7 @@ class BaseMode:
     def reset(self):  
         pass  
     
-    def get_landmark_position(self, hand_landmarks, width, height, landmark_idx):  
-        landmark = hand_landmarks.landmark[landmark_idx]  
-        x = int(landmark.x * width)  
-        y = int(landmark.y * height)  
-        return (x, y)  
+    def get_landmark_position(self, hand, width, height, landmark_idx):  
+        return hand.position(landmark_idx)  
 
 # Bu sınıf, tüm çizim modları için temel işlevselliği sağlar. Alt sınıflar tarafından genişletilerek kullanılır.  
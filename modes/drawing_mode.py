@@ -8,6 +8,7 @@ import cv2
 import numpy as np  
 from config import settings  
 from modes.base_mode import BaseMode  
+from core.hand_state import THUMB, INDEX
 
 class DrawingMode(BaseMode):  
     def __init__(self, app):  
@@ -15,15 +16,16 @@ class DrawingMode(BaseMode):
         self.name = "Drawing Mode"  
         self.status_text = "Çizim: İşaret parmağıyla çiz"  
         self.status_color = (0, 255, 0)  
+        self.poses = (INDEX, THUMB | INDEX)  
         self.drawing = False  
         self.prev_point = None  
     
-    def check_activation(self, hand_landmarks, width, height):  
-        return self.app.hand_detector.is_drawing_mode(hand_landmarks)  
+    def check_activation(self, hand, width, height):  
+        return self.app.hand_detector.is_drawing_mode(hand)  
     
-    def process(self, frame, hand_landmarks, width, height):  
+    def process(self, frame, hand, width, height):  
         index_finger_tip = self.get_landmark_position(  
-            hand_landmarks,  
+            hand,  
             width,  
             height,  
             self.mp_hands.HandLandmark.INDEX_FINGER_TIP  
@@ -34,7 +36,7 @@ class DrawingMode(BaseMode):
             self.drawing = True  
         else:  
             if self.drawing:  
-                self.app.canvas.draw_line(self.prev_point, index_finger_tip)  
+                self.app.canvas.draw_line(self.prev_point, index_finger_tip, self.app.timestamp)
             self.prev_point = index_finger_tip  
         
         cv2.circle(frame, index_finger_tip, 10, self.app.canvas.pen_color, -1)  
@@ -8,6 +8,7 @@ import cv2
 import numpy as np  
 from config import settings  
 from modes.base_mode import BaseMode  
+from core.hand_state import THUMB, INDEX, MIDDLE, RING, PINKY
 
 class EraserMode(BaseMode):  
     def __init__(self, app):  
@@ -15,27 +16,28 @@ class EraserMode(BaseMode):
         self.name = "Eraser Mode"  
         self.status_text = settings.STATUS_ERASER  
         self.status_color = (0, 165, 255)  
+        # Yüzük parmağı kalkınca silme durur; bu poz seçim moduyla çakışmasın diye serçe de kalkık olmalı  
+        self.poses = (  
+            INDEX | MIDDLE, THUMB | INDEX | MIDDLE,  
+            INDEX | MIDDLE | PINKY, THUMB | INDEX | MIDDLE | PINKY,  
+            INDEX | MIDDLE | RING | PINKY  
+        )  
         self.erasing = False  
         self.prev_point = None  
         self.eraser_size = settings.DEFAULT_ERASER_SIZE  
 
-    def check_activation(self, hand_landmarks, width, height):  
-        return (self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.INDEX_FINGER_TIP, self.mp_hands.HandLandmark.INDEX_FINGER_PIP) and  
-                self._is_finger_up(hand_landmarks, self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP, self.mp_hands.HandLandmark.MIDDLE_FINGER_PIP))  
+    def check_activation(self, hand, width, height):  
+        return hand.is_up(INDEX | MIDDLE)  
 
-    def process(self, frame, hand_landmarks, width, height):  
+    def process(self, frame, hand, width, height):  
         index_finger_tip = self.get_landmark_position(  
-            hand_landmarks,   
+            hand,   
             width,   
             height,   
             self.mp_hands.HandLandmark.INDEX_FINGER_TIP  
         )  
         
-        ring_finger_up = self._is_finger_up(  
-            hand_landmarks,   
-            self.mp_hands.HandLandmark.RING_FINGER_TIP,   
-            self.mp_hands.HandLandmark.RING_FINGER_PIP  
-        )  
+        ring_finger_up = hand.is_up(RING)  
         
         self.erasing = not ring_finger_up  
         
@@ -47,28 +49,15 @@ class EraserMode(BaseMode):
         else:  
             cv2.circle(frame, index_finger_tip, self.eraser_size, (0, 0, 255), 2)  
             status_text = settings.STATUS_ERASER_OFF  
+            self.app.canvas.commit_stroke()
         
         self.prev_point = index_finger_tip  
         return frame, status_text, self.status_color  
 
     def _erase_line(self, current_point):  
         if self.prev_point:  
-            cv2.line(  
-                self.app.canvas.canvas,   
-                self.prev_point,   
-                current_point,   
-                (0, 0, 0),   
-                self.eraser_size * 2  
-            )  
-            cv2.circle(  
-                self.app.canvas.canvas,   
-                current_point,   
-                self.eraser_size,   
-                (0, 0, 0),   
-                -1  
-            )  
-        if hash(str(current_point)) % 10 == 0:  
-            self.app.canvas.save_to_history()  
+            # Silme açık vuruşa eklenir, yüzük parmağı kalkınca tek adım olarak kaydedilir
+            self.app.canvas.erase_line(self.prev_point, current_point, self.eraser_size, self.app.timestamp)
 
     def handle_key_press(self, key):  
         if key == ord('+') or key == ord('='):  
@@ -84,9 +73,6 @@ class EraserMode(BaseMode):
         self.erasing = False  
         self.prev_point = None  
 
-    def _is_finger_up(self, hand_landmarks, tip_idx, pip_idx):  
-        return hand_landmarks.landmark[tip_idx].y < hand_landmarks.landmark[pip_idx].y  
-
 # -------------  
 # KOD AÇIKLAMASI:  
 # Bu kod, el hareketleriyle dijital bir kanvas üzerinde silme işlemi yapmayı sağlar.  
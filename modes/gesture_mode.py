@@ -10,6 +10,7 @@ import numpy as np
 import time  
 from config import settings  
 from modes.base_mode import BaseMode  
+from core.hand_state import ALL_FINGERS
 
 class GestureMode(BaseMode):  
     def __init__(self, app):  
@@ -17,6 +18,7 @@ class GestureMode(BaseMode):
         self.name = "Gesture Mode"  
         self.status_text = settings.STATUS_GESTURE  
         self.status_color = (255, 0, 255)  
+        self.poses = (ALL_FINGERS,)  
         
         self.mp_hands = mp.solutions.hands  
         
@@ -42,12 +44,12 @@ class GestureMode(BaseMode):
         self.gesture_start_time = 0  
         self.gesture_positions = []  
     
-    def check_activation(self, hand_landmarks, width, height):  
-        return self.app.hand_detector.is_gesture_mode(hand_landmarks)  
+    def check_activation(self, hand, width, height):  
+        return self.app.hand_detector.is_gesture_mode(hand)  
     
-    def process(self, frame, hand_landmarks, width, height):  
+    def process(self, frame, hand, width, height):  
         current_position = self.get_landmark_position(  
-            hand_landmarks,   
+            hand,   
             width,   
             height,   
             self.mp_hands.HandLandmark.INDEX_FINGER_TIP  
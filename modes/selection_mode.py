@@ -8,6 +8,7 @@ import cv2
 import numpy as np  
 from config import settings  
 from modes.base_mode import BaseMode  
+from core.hand_state import THUMB, INDEX, MIDDLE, RING, PINKY
 
 class SelectionMode(BaseMode):  
     def __init__(self, app):  
@@ -15,6 +16,7 @@ class SelectionMode(BaseMode):
         self.name = "Selection Mode"  
         self.status_text = "Seçim: Şekil ve nesneleri seç ve düzenle"  
         self.status_color = (255, 165, 0)  
+        self.poses = (INDEX | MIDDLE | RING, THUMB | INDEX | MIDDLE | RING)  
         
         self.selecting = False  
         self.start_point = None  
@@ -25,22 +27,18 @@ class SelectionMode(BaseMode):
         self.moving = False  
         self.last_position = None  
     
-    def check_activation(self, hand_landmarks, width, height):  
-        return self.app.hand_detector.is_selection_mode(hand_landmarks)  
+    def check_activation(self, hand, width, height):  
+        return self.app.hand_detector.is_selection_mode(hand)  
     
-    def process(self, frame, hand_landmarks, width, height):  
+    def process(self, frame, hand, width, height):  
         index_finger_tip = self.get_landmark_position(  
-            hand_landmarks,  
+            hand,  
             width,  
             height,  
             self.mp_hands.HandLandmark.INDEX_FINGER_TIP  
         )  
         
-        pinky_finger_up = self._is_finger_up(  
-            hand_landmarks,  
-            self.mp_hands.HandLandmark.PINKY_TIP,  
-            self.mp_hands.HandLandmark.PINKY_PIP  
-        )  
+        pinky_finger_up = hand.is_up(PINKY)  
         
         selecting_now = not pinky_finger_up  
         cv2.circle(frame, index_finger_tip, 10, (255, 165, 0), -1)  
@@ -129,14 +127,12 @@ class SelectionMode(BaseMode):
         if not self.selected_content:  
             return  
             
+        # Eski alanı silme ve yapıştırma tek bir geri alma adımıdır
+        self.app.canvas.commit_stroke()
+        self.app.canvas.begin_stroke()
+        
         old_x1, old_y1, old_x2, old_y2 = self.selection_rect  
-        cv2.rectangle(  
-            self.app.canvas.canvas,  
-            (old_x1, old_y1),  
-            (old_x2, old_y2),  
-            (0, 0, 0),  
-            -1  
-        )  
+        self.app.canvas.fill_rect((old_x1, old_y1), (old_x2, old_y2))
         
         new_x1, new_y1, new_x2, new_y2 = self.selected_content['rect']  
         
@@ -151,32 +147,19 @@ class SelectionMode(BaseMode):
             else:  
                 scaled_img = self.selected_content['image']  
             
-            mask = np.zeros_like(self.app.canvas.canvas)  
-            mask[new_y1:new_y2, new_x1:new_x2] = scaled_img  
-            
             non_black = np.any(scaled_img > 10, axis=2)  
-            for y in range(h):  
-                for x in range(w):  
-                    if non_black[y, x]:  
-                        self.app.canvas.canvas[new_y1 + y, new_x1 + x] = scaled_img[y, x]  
+            self.app.canvas.paste(scaled_img, (new_x1, new_y1), non_black)
             
         except Exception as e:  
             print(f"Taşıma hatası: {e}")  
         
-        self.app.canvas.save_to_history()  
+        self.app.canvas.commit_stroke()
         self.selection_rect = self.selected_content['rect']  
     
     def handle_key_press(self, key):  
         if key == ord('x') and self.selected_content:  
             x1, y1, x2, y2 = self.selected_content['rect']  
-            cv2.rectangle(  
-                self.app.canvas.canvas,  
-                (x1, y1),  
-                (x2, y2),  
-                (0, 0, 0),  
-                -1  
-            )  
-            self.app.canvas.save_to_history()  
+            self.app.canvas.fill_rect((x1, y1), (x2, y2))
             self.selected_content = None  
             self.selection_rect = None  
             return True  
@@ -221,9 +204,6 @@ class SelectionMode(BaseMode):
         self.selected_content = None  
         self.moving = False  
         self.last_position = None  
-    
-    def _is_finger_up(self, hand_landmarks, tip_idx, pip_idx):  
-        return hand_landmarks.landmark[tip_idx].y < hand_landmarks.landmark[pip_idx].y  
 
 # Kısaca açıklamak isterim: 
 # - El hareketleriyle çizimleri seçip taşımayı sağlıyor  
@@ -9,6 +9,7 @@ import numpy as np
 import math  
 from config import settings  
 from modes.base_mode import BaseMode  
+from core.hand_state import THUMB, INDEX, MIDDLE, RING
 
 class ShapeMode(BaseMode):  
     def __init__(self, app):  
@@ -21,40 +22,27 @@ class ShapeMode(BaseMode):
         self.status_text = "Şekil Modu: Dikdörtgen"  
         self.status_color = (0, 165, 255)  
     
-    def check_activation(self, hand_landmarks, frame_width, frame_height):  
+    def check_activation(self, hand, frame_width, frame_height):  
         text_mode_active = self.app.hand_detector.is_text_mode(  
-            hand_landmarks, frame_width, frame_height  
+            hand, frame_width, frame_height  
         )  
         
         if text_mode_active:  
             self.is_active = False  
             return False  
             
-        index_tip = hand_landmarks.landmark[self.app.hand_detector.mp_hands.HandLandmark.INDEX_FINGER_TIP]  
-        index_pip = hand_landmarks.landmark[self.app.hand_detector.mp_hands.HandLandmark.INDEX_FINGER_PIP]  
-        
-        middle_tip = hand_landmarks.landmark[self.app.hand_detector.mp_hands.HandLandmark.MIDDLE_FINGER_TIP]  
-        middle_pip = hand_landmarks.landmark[self.app.hand_detector.mp_hands.HandLandmark.MIDDLE_FINGER_PIP]  
-        
-        ring_tip = hand_landmarks.landmark[self.app.hand_detector.mp_hands.HandLandmark.RING_FINGER_TIP]  
-        ring_pip = hand_landmarks.landmark[self.app.hand_detector.mp_hands.HandLandmark.RING_FINGER_PIP]  
-        
-        self.is_active = (  
-            index_tip.y < index_pip.y and   
-            middle_tip.y < middle_pip.y and  
-            ring_tip.y > ring_pip.y  
-        )  
+        self.is_active = hand.fingers_match(INDEX | MIDDLE, RING)  
         
         return self.is_active  
     
-    def process(self, frame, hand_landmarks, frame_width, frame_height):  
+    def process(self, frame, hand, frame_width, frame_height):  
         if not self.is_active:  
             self.is_drawing = False  
             self.start_point = None  
             return frame, "Normal Mod", (0, 0, 255)  
         
         index_x, index_y = self.app.hand_detector.get_landmark_position(  
-            hand_landmarks,   
+            hand,   
             frame_width,   
             frame_height,   
             self.app.hand_detector.mp_hands.HandLandmark.INDEX_FINGER_TIP  
@@ -62,10 +50,7 @@ class ShapeMode(BaseMode):
         
         cv2.circle(frame, (index_x, index_y), 8, (0, 165, 255), -1)  
         
-        thumb_tip = hand_landmarks.landmark[self.app.hand_detector.mp_hands.HandLandmark.THUMB_TIP]  
-        thumb_ip = hand_landmarks.landmark[self.app.hand_detector.mp_hands.HandLandmark.THUMB_IP]  
-        
-        thumb_is_open = thumb_tip.y < thumb_ip.y  
+        thumb_is_open = hand.is_up(THUMB)  
         
         current_point = (index_x, index_y)  
         
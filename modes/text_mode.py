@@ -9,6 +9,7 @@ import time
 import numpy as np  
 from config import settings  
 from modes.base_mode import BaseMode  
+from core.hand_state import THUMB, INDEX, MIDDLE, RING, PINKY
 
 class TextMode(BaseMode):  
     def __init__(self, app):  
@@ -16,6 +17,12 @@ class TextMode(BaseMode):
         self.name = "Text Mode"  
         self.status_text = "Yazı: İşaret parmağı ve başparmak ile yazı ekle"  
         self.status_color = (255, 0, 0)  
+        # Kıskaç mesafesi ek koşuldur; tutmazsa pozun diğer sahibi seçilir  
+        self.poses = (  
+            MIDDLE | RING | PINKY, THUMB | MIDDLE | RING | PINKY,  
+            INDEX | MIDDLE | RING | PINKY, THUMB | INDEX | MIDDLE | RING | PINKY  
+        )  
+        self.pose_predicate = self.check_activation  
         
         self.typing = False  
         self.text = ""  
@@ -36,14 +43,14 @@ class TextMode(BaseMode):
         self.key_press_time = 0  
         self.key_cooldown = 0.5  
 
-    def check_activation(self, hand_landmarks, width, height):  
-        return self.app.hand_detector.is_text_mode(hand_landmarks, width, height)  
+    def check_activation(self, hand, width, height):  
+        return self.app.hand_detector.is_text_mode(hand, width, height)  
 
-    def process(self, frame, hand_landmarks, width, height):  
+    def process(self, frame, hand, width, height):  
         # Kıskaç hareketi kontrolü  
-        thumb_tip = self.get_landmark_position(hand_landmarks, width, height, self.mp_hands.HandLandmark.THUMB_TIP)  
-        index_tip = self.get_landmark_position(hand_landmarks, width, height, self.mp_hands.HandLandmark.INDEX_FINGER_TIP)  
-        pinch_distance = np.sqrt((thumb_tip[0] - index_tip[0])**2 + (thumb_tip[1] - index_tip[1])**2)  
+        thumb_tip = self.get_landmark_position(hand, width, height, self.mp_hands.HandLandmark.THUMB_TIP)  
+        index_tip = self.get_landmark_position(hand, width, height, self.mp_hands.HandLandmark.INDEX_FINGER_TIP)  
+        pinch_distance = hand.distance(self.mp_hands.HandLandmark.THUMB_TIP, self.mp_hands.HandLandmark.INDEX_FINGER_TIP)  
         is_pinching = pinch_distance < 40  
 
         # Yazı pozisyonu (başparmak ve işaret parmağı ortası)  
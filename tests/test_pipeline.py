@@ -0,0 +1,57 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import os
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from config import settings
+from core.app import AirDrawApp
+from core.process_detector import ProcessHandDetector
+
+FRAME_COUNT = 60
+
+def _write_frames(directory, count):
+    # Her kare tek renklidir; değer kare sırasını verir, aynalama değeri bozmaz
+    for idx in range(count):
+        frame = np.full((48, 64, 3), idx + 1, dtype=np.uint8)
+        cv2.imwrite(os.path.join(directory, f"frame_{idx:04d}.png"), frame)
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_displayed_frame_matches_detected_frame(tmp_path, monkeypatch, workers):
+    _write_frames(str(tmp_path), FRAME_COUNT)
+    monkeypatch.setattr(settings, "PIPELINED_RUNTIME", True)
+    monkeypatch.setattr(settings, "ADAPTIVE_QUALITY", False)
+    monkeypatch.setattr(cv2, "imshow", lambda *args: None)
+    monkeypatch.setattr(cv2, "waitKey", lambda *args: -1)
+    monkeypatch.setattr(cv2, "destroyAllWindows", lambda: None)
+
+    detector = ProcessHandDetector(backend="synthetic", workers=workers)
+    app = AirDrawApp(source=str(tmp_path), realtime=False, hand_detector=detector)
+
+    # Kare pikselleri tespit ile ekran arasında değişmesin diye mod/kanvas aşaması pikselleri elle sürmez
+    app.engine.draw_landmarks = False
+    app.engine.update = lambda frame, results, timestamp: (frame, "", (0, 0, 0))
+
+    displayed = []
+
+    def compose_stage(frame, fps, mode, queue_depths=None):
+        # Yavaş ekran: kuyruklar dolar ve tampon halkası en derin kullanımına ulaşır
+        time.sleep(0.02)
+        displayed.append((int(frame.min()), int(frame.max())))
+        return frame
+
+    app.compose_stage = compose_stage
+    app.run()
+
+    assert app.pipeline.frames_out_of_order == 0
+    assert len(displayed) == FRAME_COUNT
+    # Sıra korunduğu için k. gösterilen kare k. okunan karedir
+    overwritten = [idx for idx, values in enumerate(displayed) if values != (idx + 1, idx + 1)]
+    assert overwritten == []
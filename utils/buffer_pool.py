@@ -0,0 +1,46 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import numpy as np
+
+class BufferPool:
+    def __init__(self, depth=1):
+        self.depth = max(1, depth)
+        self.buffers = {}
+        self.cursors = {}
+
+    def get(self, name, shape, dtype=np.uint8):
+        key = (name, tuple(shape), np.dtype(dtype))
+        ring = self.buffers.get(key)
+        if ring is None:
+            ring = [np.empty(shape, dtype=dtype) for _ in range(self.depth)]
+            self.buffers[key] = ring
+            self.cursors[key] = 0
+
+        idx = self.cursors[key]
+        self.cursors[key] = (idx + 1) % len(ring)
+        return ring[idx]
+
+    def set_depth(self, depth):
+        depth = max(1, depth)
+        if depth != self.depth:
+            self.depth = depth
+            self.clear()
+
+    def clear(self):
+        self.buffers = {}
+        self.cursors = {}
+
+    @property
+    def nbytes(self):
+        return sum(buf.nbytes for ring in self.buffers.values() for buf in ring)
+
+# -----------------------------------------------------------------
+# Her karede yeniden ayrılan büyük dizileri (çevrilmiş kare, RGB kopyası vb.)
+# tekrar kullanmak için basit bir tampon havuzu. Tamponlar ad, boyut ve veri
+# tipine göre tutulur. depth > 1 olduğunda aynı ad için sırayla farklı
+# tamponlar verilir; boru hattında aynı anda işlenen kareler birbirini ezmez.
+# -----------------------------------------------------------------
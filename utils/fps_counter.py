@@ -14,7 +14,8 @@ class FPSCounter:
     
     def update(self):  
         current_time = time.time()  
-        fps = 1 / (current_time - self.prev_time)  
+        frame_time = current_time - self.prev_time
+        fps = 1 / frame_time if frame_time > 0 else 0  
         self.prev_time = current_time  
         
         self.fps_list.append(fps)  
@@ -0,0 +1,79 @@
+# -----------------------------------------------------------------
+# Batuhan Korkmaz
+# Full Stack Developer & EdTech Girişimcisi
+# https://www.linkedin.com/in/batuhanfy/
+# -----------------------------------------------------------------
+
+import cv2
+import numpy as np
+from config import settings
+from core.hand_landmarks import NUM_LANDMARKS, landmarks_to_array
+
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)
+)
+FINGER_TIPS = (4, 8, 12, 16, 20)
+
+class SkeletonRenderer:
+    def __init__(self, style=settings.SKELETON_STYLE, bone_color=(224, 224, 224), joint_color=(0, 0, 255),
+                 tip_color=(255, 0, 255), bone_thickness=2, joint_radius=4, tip_radius=6):
+        self.style = style
+        self.bone_color = bone_color
+        self.joint_color = joint_color
+        self.tip_color = tip_color
+        self.bone_thickness = bone_thickness
+        self.joint_radius = joint_radius
+        self.tip_radius = tip_radius
+
+        # Bağlantı indeksleri bir kez diziye çevrilir; kemikler tek fancy-index ile oluşturulur
+        self.connections = np.array(HAND_CONNECTIONS, dtype=np.intp)
+        self.joints = np.array([idx for idx in range(NUM_LANDMARKS) if idx not in FINGER_TIPS], dtype=np.intp)
+        self.tips = np.array(FINGER_TIPS, dtype=np.intp)
+
+        self.landmarks = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+        self.pixels = np.empty((NUM_LANDMARKS, 2), dtype=np.int32)
+        self.dots = np.empty((NUM_LANDMARKS, 2, 2), dtype=np.int32)
+
+    def draw(self, frame, results):
+        if not results.multi_hand_landmarks:
+            return frame
+
+        height, width = frame.shape[:2]
+        scale = np.array([width, height], dtype=np.float32)
+        for hand_landmarks in results.multi_hand_landmarks:
+            landmarks_to_array(hand_landmarks, self.landmarks)
+            np.multiply(self.landmarks[:, :2], scale, out=self.landmarks[:, :2])
+            self.pixels[...] = self.landmarks[:, :2]
+            self.draw_pixels(frame, self.pixels)
+        return frame
+
+    def draw_pixels(self, frame, pixels):
+        if self.style == "tips":
+            self._draw_dots(frame, pixels, self.tips, self.tip_color, self.tip_radius)
+            return frame
+
+        # Tüm kemikler iki noktalı çizgiler olarak tek polylines çağrısıyla çizilir
+        cv2.polylines(frame, pixels[self.connections], False, self.bone_color, self.bone_thickness)
+        self._draw_dots(frame, pixels, self.joints, self.joint_color, self.joint_radius)
+        self._draw_dots(frame, pixels, self.tips, self.tip_color, self.joint_radius)
+        return frame
+
+    def _draw_dots(self, frame, pixels, indices, color, radius):
+        # Başı ve sonu aynı olan kalın çizgi yuvarlak uçlu olduğu için dolu daire verir;
+        # böylece tüm eklemler tek çağrıda çizilir
+        dots = self.dots[:len(indices)]
+        dots[:, 0] = pixels[indices]
+        dots[:, 1] = dots[:, 0]
+        cv2.polylines(frame, dots, False, color, radius * 2)
+
+# -----------------------------------------------------------------
+# Landmark iskeletini hızlı çizen sınıf. mp_drawing.draw_landmarks her karede
+# stil sözlüklerini yeniden kurar ve her kemik ile eklem için ayrı çağrı yapar.
+# Burada bağlantı dizileri ve renkler bir kez hazırlanır; tüm kemikler tek
+# cv2.polylines, eklemler ve parmak uçları birer toplu çağrıyla çizilir.
+# "tips" stili sadece parmak uçlarını gösterir (settings.SKELETON_STYLE).
+# -----------------------------------------------------------------